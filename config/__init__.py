@@ -25,12 +25,20 @@ from .constants import (
     RETRY_INITIAL_DELAY,
     RETRY_BACKOFF_MULTIPLIER,
     RETRY_MAX_DELAY,
+    RETRY_STATUS_CODES,
     get_retry_delay,
     # Ollama
     OLLAMA_HOST,
     OLLAMA_API_ENDPOINT,
     DEFAULT_ENHANCEMENT_MODEL,
+    OLLAMA_MODEL_TAG,
     ENHANCEMENT_TIMEOUT,
+    OLLAMA_CONNECT_TIMEOUT,
+    OLLAMA_KEEP_ALIVE,
+    OLLAMA_PROBE_TIMEOUT,
+    OLLAMA_PROBE_CACHE_TTL,
+    ENHANCEMENT_BATCH_SIZE,
+    ENHANCEMENT_BUCKET_RATIO,
     # Validation
     VALIDATE_PROMPT_LENGTH,
     PROMPT_MIN_LENGTH,
@@ -44,6 +52,12 @@ from .constants import (
     DEFAULT_DETAIL_LEVEL,
     DEFAULT_STYLE,
     DEFAULT_LENGTH,
+    # Response cache
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_PATH,
+    LLM_CACHE_TTL,
+    LLM_CACHE_MAX_ENTRIES,
+    CACHE_CREATIVITY_STEP,
     # Logging
     LOG_LEVEL,
     LOG_FORMAT,
@@ -67,12 +81,20 @@ __all__ = [
     'RETRY_INITIAL_DELAY',
     'RETRY_BACKOFF_MULTIPLIER',
     'RETRY_MAX_DELAY',
+    'RETRY_STATUS_CODES',
     'get_retry_delay',
     # Ollama
     'OLLAMA_HOST',
     'OLLAMA_API_ENDPOINT',
     'DEFAULT_ENHANCEMENT_MODEL',
+    'OLLAMA_MODEL_TAG',
     'ENHANCEMENT_TIMEOUT',
+    'OLLAMA_CONNECT_TIMEOUT',
+    'OLLAMA_KEEP_ALIVE',
+    'OLLAMA_PROBE_TIMEOUT',
+    'OLLAMA_PROBE_CACHE_TTL',
+    'ENHANCEMENT_BATCH_SIZE',
+    'ENHANCEMENT_BUCKET_RATIO',
     # Validation
     'VALIDATE_PROMPT_LENGTH',
     'PROMPT_MIN_LENGTH',
@@ -86,6 +108,12 @@ __all__ = [
     'DEFAULT_DETAIL_LEVEL',
     'DEFAULT_STYLE',
     'DEFAULT_LENGTH',
+    # Response cache
+    'RESPONSE_CACHE_ENABLED',
+    'RESPONSE_CACHE_PATH',
+    'LLM_CACHE_TTL',
+    'LLM_CACHE_MAX_ENTRIES',
+    'CACHE_CREATIVITY_STEP',
     # Logging
     'LOG_LEVEL',
     'LOG_FORMAT',
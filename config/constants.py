@@ -18,6 +18,7 @@ Version: 5.1.0
 import logging
 from enum import Enum
 from dataclasses import dataclass
+from pathlib import Path
 
 # ============================================================================
 # LOGGING SETUP
@@ -45,6 +46,9 @@ RETRY_BACKOFF_MULTIPLIER = 2
 RETRY_MAX_DELAY = 30
 """Maximum delay between retries in seconds (cap)"""
 
+RETRY_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+"""HTTP status codes worth retrying; any other error status fails immediately"""
+
 
 def get_retry_delay(attempt: int) -> float:
     """
@@ -82,9 +86,34 @@ OLLAMA_API_ENDPOINT = f"{OLLAMA_HOST}/api/generate"
 DEFAULT_ENHANCEMENT_MODEL = "mistral"
 """Default model to use for prompt enhancement"""
 
+OLLAMA_MODEL_TAG = None
+"""
+Optional Ollama tag appended to untagged model names to pick a quantization,
+e.g. "7b-instruct-q4_K_M" or "7b-instruct-q8_0". Lower-bit weights move fewer
+bytes per decoded token (faster, smaller); None keeps Ollama's default tag.
+"""
+
 ENHANCEMENT_TIMEOUT = 60
 """Timeout in seconds for Ollama API calls"""
 
+OLLAMA_CONNECT_TIMEOUT = 3.05
+"""Connect timeout in seconds - a stopped Ollama fails fast instead of after ENHANCEMENT_TIMEOUT"""
+
+OLLAMA_KEEP_ALIVE = "10m"
+"""How long Ollama keeps the model loaded after a request (avoids reload between enhancements)"""
+
+OLLAMA_PROBE_TIMEOUT = 0.3
+"""TCP probe timeout in seconds used to detect a stopped Ollama after a connection error"""
+
+OLLAMA_PROBE_CACHE_TTL = 2.0
+"""Seconds a probe result is reused before probing again"""
+
+ENHANCEMENT_BATCH_SIZE = 4
+"""Requests of one batch kept in flight at once (Ollama decodes them together when OLLAMA_NUM_PARALLEL > 1)"""
+
+ENHANCEMENT_BUCKET_RATIO = 1.25
+"""Max estimated-length ratio inside one batch bucket (longest / shortest request)"""
+
 
 # ============================================================================
 # INPUT VALIDATION CONSTANTS
@@ -131,6 +160,26 @@ DEFAULT_LENGTH = 350
 """Default enhanced prompt length in words"""
 
 
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+RESPONSE_CACHE_ENABLED = True
+"""Enable/disable on-disk cache of successful enhancement responses"""
+
+RESPONSE_CACHE_PATH = Path.home() / ".cache" / "svd-prompt-enhancer.db"
+"""SQLite database file for the response cache"""
+
+LLM_CACHE_TTL = 3600
+"""Seconds a worker-level cached LLM result stays valid"""
+
+LLM_CACHE_MAX_ENTRIES = 256
+"""Maximum number of LLM results kept in memory (LRU eviction)"""
+
+CACHE_CREATIVITY_STEP = 0.05
+"""Creativity is rounded to this step in cache keys, so near-identical settings share an entry"""
+
+
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -180,12 +229,20 @@ __all__ = [
     'RETRY_INITIAL_DELAY',
     'RETRY_BACKOFF_MULTIPLIER',
     'RETRY_MAX_DELAY',
+    'RETRY_STATUS_CODES',
     'get_retry_delay',
     # Ollama
     'OLLAMA_HOST',
     'OLLAMA_API_ENDPOINT',
     'DEFAULT_ENHANCEMENT_MODEL',
+    'OLLAMA_MODEL_TAG',
     'ENHANCEMENT_TIMEOUT',
+    'OLLAMA_CONNECT_TIMEOUT',
+    'OLLAMA_KEEP_ALIVE',
+    'OLLAMA_PROBE_TIMEOUT',
+    'OLLAMA_PROBE_CACHE_TTL',
+    'ENHANCEMENT_BATCH_SIZE',
+    'ENHANCEMENT_BUCKET_RATIO',
     # Validation
     'VALIDATE_PROMPT_LENGTH',
     'PROMPT_MIN_LENGTH',
@@ -199,6 +256,12 @@ __all__ = [
     'DEFAULT_DETAIL_LEVEL',
     'DEFAULT_STYLE',
     'DEFAULT_LENGTH',
+    # Response cache
+    'RESPONSE_CACHE_ENABLED',
+    'RESPONSE_CACHE_PATH',
+    'LLM_CACHE_TTL',
+    'LLM_CACHE_MAX_ENTRIES',
+    'CACHE_CREATIVITY_STEP',
     # Logging
     'LOG_LEVEL',
     'LOG_FORMAT',
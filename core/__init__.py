@@ -53,6 +53,15 @@ class ParseResult:
 # SAFE JSON HANDLER
 # ============================================================================
 
+# Compiled once at import; the handler itself holds no mutable state,
+# so one instance can be shared across threads
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+_KEY_VALUE_RE = re.compile(r'"([^"]+)"\s*:\s*"?([^",}]+)"?')
+# Values recovered by SPLIT may carry raw control chars:
+# tabs/newlines become spaces, remaining ASCII control chars are dropped
+_CTRL_TABLE = dict.fromkeys(range(0x20))
+_CTRL_TABLE.update(str.maketrans('\t\n\r', '   '))
+
 class SafeJSONHandler:
     """
     Robust JSON parser with 4 fallback strategies.
@@ -133,8 +142,7 @@ class SafeJSONHandler:
         """Strategy 2: Regex-based text extraction"""
         try:
             # Try to find JSON object pattern
-            json_pattern = r'\{[\s\S]*\}'
-            match = re.search(json_pattern, text)
+            match = _JSON_OBJECT_RE.search(text)
             
             if not match:
                 return ParseResult(success=False, error_message="No JSON-like pattern found")
@@ -163,8 +171,7 @@ class SafeJSONHandler:
             data = {}
             
             # Look for patterns like "key": "value" or "key": number
-            pattern = r'"([^"]+)"\s*:\s*"?([^",}]+)"?'
-            matches = re.findall(pattern, text)
+            matches = _KEY_VALUE_RE.findall(text)
             
             if not matches:
                 return ParseResult(success=False, error_message="No key-value pairs found")
@@ -179,7 +186,7 @@ class SafeJSONHandler:
                     except ValueError:
                         data[key] = value
                 else:
-                    data[key] = value
+                    data[key] = value.translate(_CTRL_TABLE)
             
             if self.debug:
                 logger.debug(f"Strategy SPLIT successful")
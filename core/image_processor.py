@@ -4,12 +4,22 @@ Analiza obrazów (PIL + NumPy)
 """
 
 from PIL import Image
+import io
 import numpy as np
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+ATTRIBUTE_MAX_SIDE = 1024
+"""Maksymalny bok obrazu dla heurystyk atrybutów (statystyki nie potrzebują pełnej rozdzielczości)"""
+
+
+def _channel_means(arr: np.ndarray) -> tuple:
+    """Średnie R, G, B w jednym przebiegu po pikselach (zamiast trzech)"""
+    r, g, b = arr.reshape(-1, 3).mean(axis=0)
+    return float(r), float(g), float(b)
+
 
 class ImageAnalyzer:
     """Analiza techniczna obrazów"""
@@ -18,7 +28,17 @@ class ImageAnalyzer:
     def analyze_image(image_path: str) -> dict:
         """Analiza szczegółowa obrazu"""
         try:
-            img = Image.open(image_path)
+            data = Path(image_path).read_bytes()
+        except OSError as e:
+            logger.error(f"Błąd analizy obrazu: {e}")
+            return {"error": str(e)}
+        return ImageAnalyzer.analyze_bytes(data, Path(image_path).name)
+    
+    @staticmethod
+    def analyze_bytes(data: bytes, filename: str) -> dict:
+        """Analiza obrazu z bufora w pamięci (bez ponownego open/stat/read)"""
+        try:
+            img = Image.open(io.BytesIO(data))
             w, h = img.size
             format_img = img.format
             mode = img.mode
@@ -26,17 +46,15 @@ class ImageAnalyzer:
             if mode != 'RGB':
                 img = img.convert('RGB')
             
-            arr = np.array(img, dtype=np.uint8)
+            arr = np.asarray(img, dtype=np.uint8)
             
-            r_mean = float(np.mean(arr[:,:,0]))
-            g_mean = float(np.mean(arr[:,:,1]))
-            b_mean = float(np.mean(arr[:,:,2]))
+            r_mean, g_mean, b_mean = _channel_means(arr)
             luminance = 0.299*r_mean + 0.587*g_mean + 0.114*b_mean
             
-            file_size = Path(image_path).stat().st_size / 1024
+            file_size = len(data) / 1024
             
             return {
-                "filename": Path(image_path).name,
+                "filename": filename,
                 "format": format_img,
                 "size_kb": round(file_size, 1),
                 "width": w,
@@ -60,11 +78,26 @@ class DeepAttributeAnalyzer:
     def analyze(image_path: str) -> dict:
         """Głębokie rozpoznawanie atrybutów"""
         try:
-            img = Image.open(image_path)
+            data = Path(image_path).read_bytes()
+        except OSError as e:
+            logger.error(f"Błąd atrybutów: {e}")
+            return {"detected": []}
+        return DeepAttributeAnalyzer.analyze_bytes(data)
+    
+    @staticmethod
+    def analyze_bytes(data: bytes) -> dict:
+        """Rozpoznawanie atrybutów z bufora w pamięci"""
+        try:
+            img = Image.open(io.BytesIO(data))
+            # JPEG: dekodowanie od razu w zmniejszonej skali (DCT), reszta: reduce()
+            img.draft('RGB', (ATTRIBUTE_MAX_SIDE, ATTRIBUTE_MAX_SIDE))
             if img.mode != 'RGB':
                 img = img.convert('RGB')
+            factor = max(img.size) // ATTRIBUTE_MAX_SIDE
+            if factor > 1:
+                img = img.reduce(factor)
             
-            arr = np.array(img, dtype=np.uint8)
+            arr = np.asarray(img, dtype=np.uint8)
             
             detected = []
             
@@ -74,9 +107,7 @@ class DeepAttributeAnalyzer:
                 detected.append("osoba/osoby")
             
             # Kolory
-            r_mean = float(np.mean(arr[:,:,0]))
-            g_mean = float(np.mean(arr[:,:,1]))
-            b_mean = float(np.mean(arr[:,:,2]))
+            r_mean, g_mean, b_mean = _channel_means(arr)
             
             if r_mean > b_mean:
                 detected.append("ciepłe tony")
@@ -106,13 +137,12 @@ class DeepAttributeAnalyzer:
         try:
             r, g, b = arr[:,:,0], arr[:,:,1], arr[:,:,2]
             
-            skin_mask = (
-                ((r > 95) & (g > 40) & (b > 20) & (r > g) & (r > b)) |
-                ((r > 150) & (g > 100) & (b > 60) & (r > g) & (r > b))
-            )
+            # Drugi warunek (r>150, g>100, b>60) zawiera się w pierwszym,
+            # więc jedna maska daje ten sam wynik przy połowie przebiegów
+            skin_mask = (r > 95) & (g > 40) & (b > 20) & (r > g) & (r > b)
             
             height, width = arr.shape[:2]
-            skin_ratio = np.sum(skin_mask) / (height * width)
+            skin_ratio = np.count_nonzero(skin_mask) / (height * width)
             
             return bool(skin_ratio > 0.10)
         except:
@@ -18,6 +18,11 @@ from enum import Enum
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Translation table for values recovered by partial parsing:
+# tabs/newlines become spaces, remaining ASCII control chars are dropped
+_CTRL_TABLE = dict.fromkeys(range(0x20))
+_CTRL_TABLE.update(str.maketrans('\t\n\r', '   '))
+
 
 class JSONExtractionStrategy(Enum):
     """Strategies for JSON extraction in order of preference"""
@@ -243,6 +248,7 @@ class SafeJSONHandler:
             # Build dict from matches
             reconstructed = {}
             for key, value in matches:
+                value = value.translate(_CTRL_TABLE)
                 reconstructed[key] = value
                 logger.debug(f"Strategy 3: Extracted {key}='{value[:30]}...'")
             
@@ -398,6 +404,21 @@ class TestSafeJSONHandler:
         print("✅ Test 3 PASSED: Malformed JSON fallback")
         return True
     
+    @staticmethod
+    def test_partial_parse_control_chars():
+        """Test 4: Partial parse should strip control chars from values"""
+        handler = SafeJSONHandler(debug=True)
+        
+        broken = '{"prompt_en": "a woman\n\ton a beach\x07", "prompt_pl": "kobieta\r\nna plaży" ,,}'
+        result = handler.parse(broken)
+        
+        assert result.success, "Broken JSON with required keys should parse partially"
+        assert result.strategy_used == JSONExtractionStrategy.PARTIAL_PARSE
+        assert result.data['prompt_en'] == "a woman  on a beach"
+        assert result.data['prompt_pl'] == "kobieta  na plaży"
+        print("✅ Test 4 PASSED: Partial parse control chars")
+        return True
+    
     @staticmethod
     def run_all_tests():
         """Run all unit tests"""
@@ -409,6 +430,7 @@ class TestSafeJSONHandler:
             TestSafeJSONHandler.test_valid_json()
             TestSafeJSONHandler.test_json_with_surrounding_text()
             TestSafeJSONHandler.test_malformed_json()
+            TestSafeJSONHandler.test_partial_parse_control_chars()
             
             print("\n" + "="*70)
             print("✅ ALL TESTS PASSED")
@@ -89,6 +89,7 @@ except ImportError as e:
 try:
     logger.info("Importing workers...")
     from workers import EnhancementWorker, EnhancementResult
+    from workers.prewarm import schedule_prewarm
     logger.info("✅ Workers loaded")
 except ImportError as e:
     logger.error(f"❌ Failed to import workers: {e}")
@@ -279,6 +280,7 @@ class MainWindow(QMainWindow):
         en_label = QLabel("🌐 English:")
         self.en_field = QTextEdit()
         self.en_field.setReadOnly(True)
+        self.en_field.setAcceptRichText(False)
         self.en_field.setMinimumHeight(120)
         self.en_field.setStyleSheet("""
             QTextEdit {
@@ -296,6 +298,7 @@ class MainWindow(QMainWindow):
         pl_label = QLabel("🇵🇱 Polish:")
         self.pl_field = QTextEdit()
         self.pl_field.setReadOnly(True)
+        self.pl_field.setAcceptRichText(False)
         self.pl_field.setMinimumHeight(120)
         self.pl_field.setStyleSheet("""
             QTextEdit {
@@ -312,8 +315,19 @@ class MainWindow(QMainWindow):
         # Apply layout
         central_widget.setLayout(main_layout)
         
-        # Initialize worker
-        self.worker = None
+        # One worker for the whole window: its keep-alive session and
+        # signal connections are reused by every enhancement
+        self.worker = EnhancementWorker(debug=False)
+        self.worker.progress.connect(self.on_progress)
+        self.worker.error_occurred.connect(self.on_error_occurred)
+        QApplication.instance().aboutToQuit.connect(self.worker.close)
+        
+        # Settings of the last request: clicking again with the same ones
+        # asks for a new variation instead of the cached result
+        self._last_request = None
+        
+        # Load the model in the background before the first click
+        schedule_prewarm(self.worker)
         
         logger.info("✅ MainWindow initialized")
     
@@ -346,25 +360,26 @@ class MainWindow(QMainWindow):
         self.pl_field.clear()
         self.progress_bar.setValue(0)
         
-        # Create worker
-        self.worker = EnhancementWorker(debug=False)
-        self.worker.status_changed.connect(self.on_status_changed)
-        self.worker.progress_updated.connect(self.on_progress_updated)
-        self.worker.error_occurred.connect(self.on_error_occurred)
+        # Reuse worker (clear a previous cancel)
+        self.worker.cancelled.clear()
         
-        # Run enhancement (blocking, simple version)
-        result = self.worker.enhance_direct(
+        request = dict(
             prompt=prompt,
             creativity=DEFAULT_CREATIVITY,
             length=self.length_spin.value(),
             details=self.detail_combo.currentText(),
             style=self.style_combo.currentText()
         )
+        regenerate = request == self._last_request
+        self._last_request = request
+        
+        # Run enhancement (blocking, simple version)
+        result = self.worker.enhance_direct(**request, regenerate=regenerate)
         
         # Display results
         if result.success:
-            self.en_field.setText(result.prompt_en or "(No English prompt)")
-            self.pl_field.setText(result.prompt_pl or "(No Polish prompt)")
+            self.en_field.setPlainText(result.prompt_en or "(No English prompt)")
+            self.pl_field.setPlainText(result.prompt_pl or "(No Polish prompt)")
             
             status_msg = f"✅ Success! Attempt {result.attempts}, Strategy: {result.strategy_used}"
             self.status_label.setText(f"📊 Status: {status_msg}")
@@ -398,17 +413,15 @@ class MainWindow(QMainWindow):
             self.cancel_button.setEnabled(False)
             self.input_field.setEnabled(True)
     
-    @pyqtSlot(str)
-    def on_status_changed(self, status: str):
-        """Handle status change signal"""
-        self.status_label.setText(f"📊 Status: {status}")
-        logger.debug(f"Status: {status}")
-    
-    @pyqtSlot(str, int)
-    def on_progress_updated(self, message: str, value: int):
-        """Handle progress update signal"""
-        self.progress_bar.setValue(min(100, value * 20))
-        logger.debug(f"Progress: {message} ({value})")
+    @pyqtSlot(object)
+    def on_progress(self, update: dict):
+        """Handle combined progress signal (status, message, percent)"""
+        if 'status' in update:
+            self.status_label.setText(f"📊 Status: {update['status']}")
+        if 'percent' in update:
+            self.progress_bar.setValue(update['percent'])
+        if 'message' in update:
+            logger.debug(f"Progress: {update['message']}")
     
     @pyqtSlot(str)
     def on_error_occurred(self, error: str):
@@ -0,0 +1,355 @@
+"""
+Unit tests for EnhancementWorker
+
+Run with: python -m pytest -q (from the project root)
+"""
+
+import json
+import socket
+import threading
+
+import pytest
+import requests
+
+from config import (
+    ENHANCEMENT_BATCH_SIZE, ENHANCEMENT_BUCKET_RATIO, RETRY_ENABLED, RETRY_MAX_ATTEMPTS,
+    RETRY_STATUS_CODES, get_retry_delay,
+)
+from utils.response_cache import LLMCache
+from workers import enhancement_worker
+from workers.enhancement_worker import (
+    EnhancementResult, EnhancementWorker, StreamFieldExtractor, _ollama_address,
+)
+
+
+def test_worker_initialization():
+    """Test 1: Worker initializes correctly"""
+    worker = EnhancementWorker(debug=True)
+
+    assert worker is not None
+    assert worker.json_handler is not None
+    assert RETRY_ENABLED is True
+    assert RETRY_MAX_ATTEMPTS == 3
+
+
+def test_system_prompt_building():
+    """Test 2: System prompts are built correctly"""
+    worker = EnhancementWorker(debug=True)
+
+    # Test Wysoki detail
+    prompt = worker._build_system_prompt("Wysoki", "Kinematograficzny")
+    assert "master prompt engineer" in prompt
+    assert "cinematic" in prompt
+
+    # Test Niski detail
+    prompt = worker._build_system_prompt("Niski", "Artystyczny")
+    assert "briefly" in prompt
+    assert "artistic" in prompt
+
+
+def test_enhancement_prompt_building():
+    """Test 3: Enhancement prompts are properly formatted"""
+    worker = EnhancementWorker(debug=True)
+
+    prompt = worker._build_enhancement_prompt(
+        prompt="beautiful woman",
+        creativity=0.7,
+        length=350,
+        details="Wysoki",
+        style="Kinematograficzny"
+    )
+
+    assert "prompt_en" in prompt
+    assert "prompt_pl" in prompt
+    assert "350" in prompt
+    assert "JSON" in prompt
+    assert "beautiful woman" in prompt
+
+
+def test_retry_delay_calculation():
+    """Test 4: Retry delays are calculated correctly"""
+
+    # Test exponential backoff
+    assert get_retry_delay(0) == 2.0
+    assert get_retry_delay(1) == 4.0
+    assert get_retry_delay(2) == 8.0
+    assert get_retry_delay(3) == 16.0
+
+    # Test capping at max delay
+    assert get_retry_delay(10) == 30.0  # Capped
+
+
+def test_enhancement_result_dataclass():
+    """Test 5: EnhancementResult dataclass works"""
+
+    result = EnhancementResult(
+        success=True,
+        prompt_en="test",
+        prompt_pl="test",
+        attempts=1,
+        total_time=1.5
+    )
+
+    assert result.success is True
+    assert result.prompt_en == "test"
+    assert result.attempts == 1
+    assert result.total_time == 1.5
+
+    # Test failed result
+    failed = EnhancementResult(
+        success=False,
+        error_message="Test error"
+    )
+
+    assert failed.success is False
+    assert failed.error_message == "Test error"
+
+
+class _FakeStream:
+    """Streamed Ollama response echoing the original prompt into both fields"""
+
+    status_code = 200
+
+    def __init__(self, prompt=None):
+        self.prompt = prompt
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self):
+        reply = json.dumps({"prompt_en": self.prompt, "prompt_pl": self.prompt})
+        yield json.dumps({"response": reply, "done": True}).encode()
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    """Worker whose generate calls are answered locally; returns (worker, prompts sent)"""
+    monkeypatch.setattr(enhancement_worker, "_LLM_CACHE", LLMCache(ttl=60, max_entries=16))
+    worker = EnhancementWorker()
+    sent = []
+    lock = threading.Lock()
+
+    def post(url, data=None, **kwargs):
+        if data is None:
+            return _FakeStream()  # warm_up
+        prompt = json.loads(data)["prompt"].rsplit('"', 2)[1]
+        with lock:
+            sent.append(prompt)
+        return _FakeStream(prompt)
+
+    monkeypatch.setattr(worker.session, "post", post)
+    return worker, sent
+
+
+def test_enhance_batch_order_and_dedupe(fake_ollama):
+    """Test 6: Batch results line up with inputs; duplicates run once"""
+    worker, sent = fake_ollama
+    texts = ["cat", "x" * 4000, "cat", "dog " * 300, "owl", "x" * 4000]
+
+    results = worker.enhance_batch([{"prompt": text} for text in texts])
+
+    assert len(results) == len(texts)
+    assert [r.prompt_en for r in results] == texts
+    assert all(r.success for r in results)
+    assert sorted(sent) == sorted(set(texts))
+
+
+def test_stream_extractor_chunked_escapes():
+    """Test 7: Field text is decoded incrementally across chunk boundaries"""
+    extractor = StreamFieldExtractor()
+    chunks = ['{"prompt_en": "a \\', 'n\\"b\\u00', 'e9", "prom', 'pt_pl": "ko', 't\\"', '"}']
+
+    updates = [extractor.feed(chunk) for chunk in chunks]
+
+    assert extractor.complete
+    assert extractor.values == {"prompt_en": 'a \n"bé', "prompt_pl": 'kot"'}
+    assert "".join(u.get("prompt_en", "") for u in updates) == extractor.values["prompt_en"]
+
+
+def test_stream_extractor_surrogate_pair():
+    """Test 8: Escaped surrogate pairs decode to one character, even when split"""
+    extractor = StreamFieldExtractor()
+    for chunk in ['{"prompt_en": "smile \\uD83D', '\\uDE00", "prompt_pl": "\\uD83D x"}']:
+        extractor.feed(chunk)
+
+    assert extractor.values == {"prompt_en": "smile \U0001F600", "prompt_pl": "� x"}
+    # No lone surrogates left - the text is valid UTF-8 for the cache
+    json.dumps(extractor.values, ensure_ascii=False).encode("utf-8")
+
+
+def test_system_prompt_explains_tail_settings():
+    """Test 9: The cached system prompt gives units and scales for the short tail"""
+    system = EnhancementWorker._build_system_prompt("Wysoki", "Kinematograficzny")
+    tail = EnhancementWorker._build_enhancement_prompt("a cat", 0.8, 350, "Wysoki", "Kinematograficzny")
+
+    assert "length=350" in tail and "creativity=0.80" in tail
+    assert "length=<N>" in system and "around N words" in system
+    assert "creativity=<0.00-1.00>" in system and "0=conservative, 1=creative" in system
+
+
+def test_cache_hit_and_regenerate(fake_ollama):
+    """Test 10: Repeats are served from cache; regenerate asks Ollama again"""
+    worker, sent = fake_ollama
+
+    first = worker.enhance_direct("a cat")
+    cached = worker.enhance_direct("a cat")
+    fresh = worker.enhance_direct("a cat", regenerate=True)
+
+    assert sent == ["a cat", "a cat"]
+    assert cached.attempts == 0 and cached.prompt_en == first.prompt_en
+    assert fresh.attempts == 1
+
+
+def test_unparsed_reply_is_not_cached(fake_ollama, monkeypatch):
+    """Test 11: Replies without a JSON object are returned but never cached"""
+    worker, _ = fake_ollama
+    calls = []
+
+    def post(url, data=None, **kwargs):
+        calls.append(url)
+        stream = _FakeStream()
+        stream.iter_lines = lambda: iter([json.dumps({"response": "Sorry, I can't", "done": True}).encode()])
+        return stream
+
+    monkeypatch.setattr(worker.session, "post", post)
+
+    worker.enhance_direct("a cat")
+    worker.enhance_direct("a cat")
+
+    assert len(calls) == 2
+
+
+
+class _FakeErrorResponse:
+    """Non-streamed HTTP error reply"""
+
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.body = body
+
+    def raise_for_status(self):
+        raise requests.HTTPError(f"{self.status_code} error", response=self)
+
+    def iter_content(self, size):
+        yield self.body[:size]
+
+    def close(self):
+        pass
+
+
+def test_non_retryable_http_error(fake_ollama, monkeypatch):
+    """Test 12: HTTP 404 fails at once with the start of the error body"""
+    worker, _ = fake_ollama
+    calls = []
+
+    def post(url, data=None, **kwargs):
+        calls.append(url)
+        return _FakeErrorResponse(404, b'{"error": "model not found"}')
+
+    monkeypatch.setattr(worker.session, "post", post)
+
+    result = worker.enhance_direct("a cat", model="missing-model")
+
+    assert result.success is False
+    assert result.attempts == 1
+    assert len(calls) == 1
+    assert "404" in result.error_message
+    assert "model not found" in result.error_message
+
+
+def test_retryable_http_error_is_retried(fake_ollama, monkeypatch):
+    """Test 13: A status in RETRY_STATUS_CODES (503) is retried up to the limit"""
+    worker, _ = fake_ollama
+    calls = []
+
+    def post(url, data=None, **kwargs):
+        calls.append(url)
+        return _FakeErrorResponse(503, b"busy")
+
+    monkeypatch.setattr(worker.session, "post", post)
+    monkeypatch.setattr(worker, "_sleep_cancellable", lambda delay: False)
+
+    result = worker.enhance_direct("a cat")
+
+    assert 503 in RETRY_STATUS_CODES
+    assert result.success is False
+    assert len(calls) == RETRY_MAX_ATTEMPTS
+
+
+def test_length_buckets():
+    """Test 14: Buckets cut at ENHANCEMENT_BUCKET_RATIO x the shortest estimate"""
+    # Estimates (chars / 4 + length): 100, 1100, 110, 120, 130, 140, 1200
+    prompts = [{"prompt": "x" * n, "length": 100} for n in (0, 4000, 40, 80, 120, 160, 4400)]
+
+    buckets = EnhancementWorker._length_buckets(prompts, list(range(len(prompts))))
+
+    assert ENHANCEMENT_BUCKET_RATIO == 1.25
+    assert buckets == [[0, 2, 3], [4, 5], [1, 6]]
+
+
+def test_length_buckets_batch_size():
+    """Test 15: Equal lengths still split every ENHANCEMENT_BATCH_SIZE requests"""
+    prompts = [{"prompt": "a cat"}] * (ENHANCEMENT_BATCH_SIZE + 2)
+
+    buckets = EnhancementWorker._length_buckets(prompts, list(range(len(prompts))))
+
+    assert [len(bucket) for bucket in buckets] == [ENHANCEMENT_BATCH_SIZE, 2]
+
+
+
+def test_offline_probe_skips_retries(fake_ollama, monkeypatch):
+    """Test 16: Connection refused + failed probe stops after one attempt"""
+    worker, _ = fake_ollama
+
+    def post(url, data=None, **kwargs):
+        raise requests.ConnectionError("refused")
+
+    monkeypatch.setattr(worker.session, "post", post)
+    monkeypatch.setattr(EnhancementWorker, "_probe_ollama", staticmethod(lambda: False))
+
+    result = worker.enhance_direct("a cat")
+
+    assert result.success is False
+    assert result.error_message == "Ollama offline"
+    assert result.attempts == 1
+
+
+def test_probe_ollama_closed_port(monkeypatch):
+    """Test 17: Probe reports a closed port as offline and caches the answer"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        address = sock.getsockname()
+    monkeypatch.setattr(enhancement_worker, "_OLLAMA_ADDRESS", address)
+    monkeypatch.setattr(enhancement_worker, "_probe_cache", (float("-inf"), True))
+
+    assert EnhancementWorker._probe_ollama() is False
+    assert enhancement_worker._probe_cache[1] is False
+    assert EnhancementWorker._probe_ollama() is False
+
+
+def test_ollama_address_default_ports():
+    """Test 18: The probe port follows the URL scheme when none is given"""
+    assert _ollama_address("http://localhost:11434") == ("localhost", 11434)
+    assert _ollama_address("https://ollama.example.com") == ("ollama.example.com", 443)
+    assert _ollama_address("http://10.0.0.5") == ("10.0.0.5", 80)
+    assert _ollama_address("https://ollama.example.com:8443/") == ("ollama.example.com", 8443)
+
+
+def test_connection_error_names_probed_address(fake_ollama, monkeypatch):
+    """Test 19: With Ollama reachable, the final error names the probed address"""
+    worker, _ = fake_ollama
+
+    def post(url, data=None, **kwargs):
+        raise requests.ConnectionError("reset")
+
+    monkeypatch.setattr(worker.session, "post", post)
+    monkeypatch.setattr(EnhancementWorker, "_probe_ollama", staticmethod(lambda: True))
+    monkeypatch.setattr(worker, "_sleep_cancellable", lambda delay: False)
+
+    result = worker.enhance_direct("a cat")
+
+    assert result.attempts == RETRY_MAX_ATTEMPTS
+    assert result.error_message == "Cannot connect to Ollama (%s:%d)" % enhancement_worker._OLLAMA_ADDRESS
@@ -0,0 +1,172 @@
+"""
+Unit tests for ImageAnalyzer and DeepAttributeAnalyzer
+
+Each optimized path is compared with the original full-resolution code
+on small synthetic images.
+
+Run with: python -m pytest -q (from the project root)
+"""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.image_processor import ATTRIBUTE_MAX_SIDE, DeepAttributeAnalyzer, ImageAnalyzer, _channel_means
+
+
+def _reference_attributes(img: Image.Image) -> dict:
+    """Original DeepAttributeAnalyzer.analyze on a full-resolution image"""
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    arr = np.array(img, dtype=np.uint8)
+    r, g, b = arr[:, :, 0], arr[:, :, 1], arr[:, :, 2]
+    skin_mask = (
+        ((r > 95) & (g > 40) & (b > 20) & (r > g) & (r > b)) |
+        ((r > 150) & (g > 100) & (b > 60) & (r > g) & (r > b))
+    )
+    has_person = bool(np.sum(skin_mask) / (arr.shape[0] * arr.shape[1]) > 0.10)
+    r_mean, g_mean, b_mean = (float(np.mean(arr[:, :, c])) for c in range(3))
+    brightness = 0.299*r_mean + 0.587*g_mean + 0.114*b_mean
+    return {
+        "has_person": has_person,
+        "color_temp": "warm" if r_mean > b_mean else "cool",
+        "brightness": "bright" if brightness > 180 else "dark" if brightness < 100 else "medium",
+    }
+
+
+def _encode(img: Image.Image, fmt: str) -> bytes:
+    buffer = io.BytesIO()
+    img.save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def _noise_image(width: int, height: int, low, high, seed: int = 0) -> Image.Image:
+    """RGB noise with each channel drawn uniformly from [low[c], high[c])"""
+    rng = np.random.default_rng(seed)
+    arr = np.stack(
+        [rng.integers(low[c], high[c], (height, width), dtype=np.uint8) for c in range(3)],
+        axis=-1,
+    )
+    return Image.fromarray(arr, 'RGB')
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    """Small PNG on disk with its bytes"""
+    img = _noise_image(64, 48, (0, 0, 0), (256, 256, 256))
+    path = tmp_path / "ref.png"
+    path.write_bytes(_encode(img, "PNG"))
+    return path
+
+
+def test_analyze_bytes_matches_file_path(image_file):
+    """Test 1: Analysing the in-memory buffer equals analysing the file"""
+    data = image_file.read_bytes()
+
+    assert ImageAnalyzer.analyze_bytes(data, image_file.name) == ImageAnalyzer.analyze_image(str(image_file))
+    assert DeepAttributeAnalyzer.analyze_bytes(data) == DeepAttributeAnalyzer.analyze(str(image_file))
+
+
+def test_analyze_bytes_matches_original(image_file):
+    """Test 2: Stats and attributes equal the original path-based implementation"""
+    data = image_file.read_bytes()
+    arr = np.array(Image.open(image_file).convert('RGB'), dtype=np.uint8)
+    r_mean, g_mean, b_mean = (float(np.mean(arr[:, :, c])) for c in range(3))
+
+    result = ImageAnalyzer.analyze_bytes(data, image_file.name)
+
+    assert result["filename"] == "ref.png"
+    assert result["format"] == "PNG"
+    assert result["size_kb"] == round(image_file.stat().st_size / 1024, 1)
+    assert (result["width"], result["height"]) == (64, 48)
+    assert (result["r_avg"], result["g_avg"], result["b_avg"]) == (
+        round(r_mean, 1), round(g_mean, 1), round(b_mean, 1)
+    )
+    assert result["luminance"] == round(0.299*r_mean + 0.587*g_mean + 0.114*b_mean, 1)
+
+    attributes = DeepAttributeAnalyzer.analyze_bytes(data)
+    assert {k: attributes[k] for k in ("has_person", "color_temp", "brightness")} == \
+        _reference_attributes(Image.open(image_file))
+
+
+def test_unreadable_inputs():
+    """Test 3: Missing files and broken buffers report errors instead of raising"""
+    assert "error" in ImageAnalyzer.analyze_image("/nonexistent/image.png")
+    assert "error" in ImageAnalyzer.analyze_bytes(b"not an image", "x.png")
+    assert DeepAttributeAnalyzer.analyze("/nonexistent/image.png") == {"detected": []}
+    assert DeepAttributeAnalyzer.analyze_bytes(b"not an image") == {"detected": []}
+
+
+def _reference_detect_person(arr: np.ndarray) -> bool:
+    """Original two-clause skin mask with np.sum"""
+    r, g, b = arr[:, :, 0], arr[:, :, 1], arr[:, :, 2]
+    skin_mask = (
+        ((r > 95) & (g > 40) & (b > 20) & (r > g) & (r > b)) |
+        ((r > 150) & (g > 100) & (b > 60) & (r > g) & (r > b))
+    )
+    return bool(np.sum(skin_mask) / (arr.shape[0] * arr.shape[1]) > 0.10)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_channel_means_match_per_channel_mean(seed):
+    """Test 4: One reshape-based pass equals three per-channel means"""
+    arr = np.asarray(_noise_image(37, 23, (0, 0, 0), (256, 256, 256), seed))
+
+    means = tuple(float(np.mean(arr[:, :, c])) for c in range(3))
+
+    assert _channel_means(arr) == pytest.approx(means, rel=1e-12)
+
+
+@pytest.mark.parametrize("skin_pixels", [0, 999, 1000, 1001, 5000])
+def test_detect_person_threshold(skin_pixels):
+    """Test 5: The single skin mask agrees with the original at the 10% threshold"""
+    arr = np.zeros((100, 100, 3), dtype=np.uint8)
+    arr.reshape(-1, 3)[:skin_pixels] = (200, 150, 120)
+
+    assert DeepAttributeAnalyzer._detect_person(arr) == _reference_detect_person(arr)
+    assert DeepAttributeAnalyzer._detect_person(arr) == (skin_pixels > 1000)
+
+
+@pytest.mark.parametrize("red_max", [150, 170, 190, 200, 256])
+def test_detect_person_noise(red_max):
+    """Test 6: Random noise on both sides of the threshold matches the original mask"""
+    # Skin share of this noise is ~5% (red_max=150) up to ~22% (256)
+    arr = np.asarray(_noise_image(50, 40, (0, 0, 0), (red_max, 256, 256), seed=red_max))
+
+    assert DeepAttributeAnalyzer._detect_person(arr) == _reference_detect_person(arr)
+
+
+_LARGE_IMAGES = {
+    # name: (low, high) channel ranges of the noise
+    "warm_bright_skin": ((200, 150, 110), (256, 200, 160)),
+    "cool_dark": ((0, 10, 60), (40, 60, 120)),
+    "medium_mixed": ((60, 60, 60), (220, 200, 200)),
+}
+
+
+@pytest.mark.parametrize("fmt", ["PNG", "JPEG"])
+@pytest.mark.parametrize("name", sorted(_LARGE_IMAGES))
+def test_reduced_scale_matches_full_resolution(name, fmt):
+    """Test 7: Labels computed after draft/reduce equal the full-resolution ones"""
+    low, high = _LARGE_IMAGES[name]
+    img = _noise_image(2 * ATTRIBUTE_MAX_SIDE + 300, 600, low, high)
+    data = _encode(img, fmt)
+
+    result = DeepAttributeAnalyzer.analyze_bytes(data)
+
+    assert {k: result[k] for k in ("has_person", "color_temp", "brightness")} == \
+        _reference_attributes(Image.open(io.BytesIO(data)))
+
+
+def test_reduced_scale_palette_image():
+    """Test 8: Palette (P-mode) images larger than the limit are converted before reduce"""
+    img = _noise_image(2 * ATTRIBUTE_MAX_SIDE + 300, 300, (0, 10, 60), (40, 60, 120))
+    data = _encode(img.convert('P'), "GIF")
+
+    result = DeepAttributeAnalyzer.analyze_bytes(data)
+
+    assert result["detected"]
+    assert {k: result[k] for k in ("has_person", "color_temp", "brightness")} == \
+        _reference_attributes(Image.open(io.BytesIO(data)))
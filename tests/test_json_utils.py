@@ -0,0 +1,66 @@
+"""
+Unit tests for safe_dumps determinism (orjson path vs stdlib fallback)
+
+Run with: python -m pytest -q (from the project root)
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from utils import json_utils
+from utils.json_utils import safe_dumps, safe_loads
+from utils.response_cache import ResponseCache
+
+pytest.importorskip("orjson")
+
+_SAMPLES = [
+    {"b": 1, "a": {"z": [1, 2.5, None], "y": True}, "ą": "zażółć \"gęślą\"\n"},
+    {"creativity": 0.7, "length": 150, "details": "Wysoki", "style": "Kinematograficzny"},
+    {"f32": np.float32(0.7), "f64": np.float64(0.1), "i": np.int64(7), "ok": np.bool_(True)},
+    {"arr": np.array([[0.25, 0.5], [1.5, 2.0]], dtype=np.float32), "ints": np.arange(3)},
+    {"path": Path("images") / "a.png", "tuple": (1, 2)},
+    {"big": 1e20, "tiny": 1e-7, "edge": 1.5e-5, "neg": -0.0, "third": 1 / 3},
+    {"nan": float("nan"), "inf": float("inf")},
+    {"huge_int": 10 ** 20},
+    [1.0, 100.0, 1e16, 0.0001, 123456789.123],
+]
+
+
+def _fallback(monkeypatch, obj):
+    with monkeypatch.context() as m:
+        m.setattr(json_utils, "ORJSON_AVAILABLE", False)
+        return safe_dumps(obj)
+
+
+@pytest.mark.parametrize("obj", _SAMPLES)
+def test_orjson_and_fallback_identical(monkeypatch, obj):
+    """Test 1: orjson and the stdlib fallback produce the same bytes"""
+    assert safe_dumps(obj) == _fallback(monkeypatch, obj)
+
+
+def test_keys_sorted_and_compact(monkeypatch):
+    """Test 2: Both paths sort keys at every level and omit spaces"""
+    obj = {"b": {"d": 1, "c": 2}, "a": 0}
+    expected = '{"a":0,"b":{"c":2,"d":1}}'
+
+    assert safe_dumps(obj) == expected
+    assert _fallback(monkeypatch, obj) == expected
+
+
+def test_make_key_independent_of_path(monkeypatch):
+    """Test 3: ResponseCache.make_key gives the same key on both paths"""
+    params = dict(prompt="kot", details="Średni", creativity=np.float32(0.35),
+                  img={"brightness": np.float64(0.42), "size": (640, 480)})
+    key = ResponseCache.make_key(**params)
+
+    monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+    assert ResponseCache.make_key(**params) == key
+
+
+def test_fallback_roundtrip(monkeypatch):
+    """Test 4: Fallback output parses back to the same values"""
+    obj = {"tiny": 1.5e-5, "big": 1e20, "list": [0.1, -2]}
+
+    assert safe_loads(_fallback(monkeypatch, obj)) == obj
@@ -0,0 +1,73 @@
+"""
+Unit tests for extract_json_from_response
+
+Run with: python -m pytest -q (from the project root)
+"""
+
+import time
+
+from utils.regex_utils import extract_json_from_response
+
+
+def test_plain_object():
+    """Test 1: Object surrounded by prose is extracted"""
+    data = extract_json_from_response(
+        'Here you go: {"prompt_en": "a cat", "prompt_pl": "kot"} Enjoy!'
+    )
+
+    assert data == {"prompt_en": "a cat", "prompt_pl": "kot"}
+
+
+def test_nested_object():
+    """Test 2: Prompts wrapped in an outer object are found"""
+    data = extract_json_from_response(
+        '{"result": {"prompt_en": "a cat", "prompt_pl": "kot"}, "ok": true}'
+    )
+
+    assert data == {"prompt_en": "a cat", "prompt_pl": "kot"}
+
+
+def test_leading_unbalanced_brace():
+    """Test 3: An unclosed brace before the object does not hide it"""
+    data = extract_json_from_response(
+        'oops { not json {"prompt_en": "a cat", "prompt_pl": "kot"}'
+    )
+
+    assert data == {"prompt_en": "a cat", "prompt_pl": "kot"}
+
+
+def test_skips_object_without_prompts():
+    """Test 4: Earlier objects without both keys are skipped"""
+    data = extract_json_from_response(
+        '{"prompt_en": "draft"} then {"prompt_en": "a cat", "prompt_pl": "kot"}'
+    )
+
+    assert data == {"prompt_en": "a cat", "prompt_pl": "kot"}
+
+
+def test_fallback_without_json():
+    """Test 5: Responses without a valid object fall back to raw text"""
+    data = extract_json_from_response('{"prompt_en": "a cat", "prompt_pl": ')
+
+    assert data["_status"] == "fallback_raw_response"
+    assert data["prompt_en"].startswith('{"prompt_en"')
+
+
+def test_deep_nesting_falls_back():
+    """Test 6: Pathologically nested output falls back instead of raising"""
+    deep = '"prompt_en" "prompt_pl" {"a":' + '[' * 5000
+    balanced = '{"prompt_en": "a", "prompt_pl": "b", "x": ' + '[' * 5000 + ']' * 5000 + '}'
+
+    assert extract_json_from_response(deep)["_status"] == "fallback_raw_response"
+    assert extract_json_from_response(balanced)["_status"] == "fallback_raw_response"
+
+
+def test_brace_junk_is_linear():
+    """Test 7: Long brace-heavy junk is rejected in linear time"""
+    for junk in ('{"a":"' * 80000, '{"prompt_en" "prompt_pl" x}' * 20000):
+        start = time.perf_counter()
+        data = extract_json_from_response('"prompt_en" "prompt_pl" ' + junk)
+        elapsed = time.perf_counter() - start
+
+        assert data["_status"] == "fallback_raw_response"
+        assert elapsed < 2.0
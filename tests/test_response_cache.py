@@ -0,0 +1,102 @@
+"""
+Unit tests for LLMCache and ResponseCache
+
+Run with: python -m pytest -q (from the project root)
+"""
+
+import sqlite3
+
+import pytest
+
+from utils import response_cache
+from utils.response_cache import LLMCache, ResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic and wall clock: clock[0] is the current time"""
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_ttl_expiry(clock):
+    """Test 1: Entries expire after ttl seconds"""
+    cache = LLMCache(ttl=60, max_entries=4)
+    cache.put("k", {"prompt_en": "a"})
+
+    clock[0] += 59
+    assert cache.get("k") == {"prompt_en": "a"}
+
+    clock[0] += 2
+    assert cache.get("k") is None
+
+
+def test_lru_eviction():
+    """Test 2: The least recently used entry is evicted first"""
+    cache = LLMCache(ttl=60, max_entries=2)
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    cache.get("a")
+    cache.put("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.get("c") == {"v": 3}
+
+
+def test_sqlite_persistence(tmp_path, clock):
+    """Test 3: Results survive a restart and keep their age"""
+    path = tmp_path / "cache.db"
+    backend = ResponseCache(path)
+    LLMCache(ttl=60, max_entries=4, backend=backend).put("k", {"prompt_en": "ą😀"})
+    backend.close()
+
+    clock[0] += 30
+    reopened = ResponseCache(path)
+    assert LLMCache(ttl=60, max_entries=4, backend=reopened).get("k") == {"prompt_en": "ą😀"}
+
+    clock[0] += 31
+    assert LLMCache(ttl=60, max_entries=4, backend=reopened).get("k") is None
+    reopened.close()
+
+
+def test_response_cache_roundtrip(tmp_path):
+    """Test 4: ResponseCache stores by key and misses unknown keys"""
+    cache = ResponseCache(tmp_path / "cache.db")
+    key = ResponseCache.make_key(prompt="cat", c=0.7)
+
+    assert key == ResponseCache.make_key(c=0.7, prompt="cat")
+    assert cache.get(key) is None
+    cache.put(key, {"prompt_en": "a cat"})
+    assert cache.get(key) == {"prompt_en": "a cat"}
+    cache.close()
+
+
+def test_expired_rows_are_deleted(tmp_path, clock):
+    """Test 5: Rows older than ttl are removed from the file"""
+    path = tmp_path / "cache.db"
+    cache = ResponseCache(path, ttl=60)
+    cache.put("old", {"v": 1})
+    clock[0] += 61
+    cache.put("new", {"v": 2})
+
+    assert cache.get("old") is None
+    assert cache.get("new") == {"v": 2}
+    cache.close()
+
+
+def test_legacy_table_is_migrated(tmp_path):
+    """Test 6: A database without the created column is upgraded and pruned"""
+    path = tmp_path / "cache.db"
+    with sqlite3.connect(str(path)) as conn:
+        conn.execute("CREATE TABLE enh_cache (key TEXT PRIMARY KEY, response TEXT NOT NULL)")
+        conn.execute("INSERT INTO enh_cache VALUES ('old', '{}')")
+    conn.close()
+
+    cache = ResponseCache(path, ttl=60)
+    assert cache.get("old") is None
+    cache.put("new", {"v": 2})
+    assert cache.get("new") == {"v": 2}
+    cache.close()
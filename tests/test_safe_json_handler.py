@@ -0,0 +1,39 @@
+"""
+Unit tests for core.SafeJSONHandler (the handler used by the enhancement worker)
+
+Run with: python -m pytest -q (from the project root)
+"""
+
+from core import ParseStrategy, SafeJSONHandler
+
+
+def test_split_strips_control_chars():
+    """Test 1: Values recovered by SPLIT have control chars normalised"""
+    broken = '{"prompt_en": "a woman\n\ton a beach\x07", "prompt_pl": "kobieta\r\nna plaży" ,,}'
+
+    result = SafeJSONHandler().parse(broken)
+
+    assert result.success
+    assert result.strategy_used == ParseStrategy.SPLIT
+    assert result.data["prompt_en"] == "a woman  on a beach"
+    assert result.data["prompt_pl"] == "kobieta  na plaży"
+
+
+def test_split_keeps_typed_values():
+    """Test 2: Numbers and booleans recovered by SPLIT keep their types"""
+    broken = '{"prompt_en": "a cat", "score": 0.5, "count": 3, "ok": true,,}'
+
+    result = SafeJSONHandler().parse(broken)
+
+    assert result.strategy_used == ParseStrategy.SPLIT
+    assert result.data == {"prompt_en": "a cat", "score": 0.5, "count": 3, "ok": True}
+
+
+def test_direct_parse_untouched():
+    """Test 3: Valid JSON keeps escaped newlines and tabs"""
+    text = '{"prompt_en": "line one\\n\\tline two", "prompt_pl": "x"}'
+
+    result = SafeJSONHandler().parse(text)
+
+    assert result.strategy_used == ParseStrategy.DIRECT
+    assert result.data["prompt_en"] == "line one\n\tline two"
@@ -60,6 +60,10 @@ class MainWindow(QMainWindow):
         tabs.addTab(QWidget(), "ℹ️ O programie")
         
         self.setCentralWidget(tabs)
+        
+        # Model ładowany w tle, zanim użytkownik kliknie "Wzbogać"
+        from workers.prewarm import schedule_prewarm
+        schedule_prewarm(self.enhance_tab.enhancement_worker)
     
     def closeEvent(self, event):
         """Przed zamknięciem"""
@@ -76,6 +76,40 @@ DARK_STYLESHEET = """
 """
 
 
+ENHANCE_TAB_STYLESHEET = """
+    QLabel#info {
+        color: #FF9800;
+        font-size: 11px;
+        margin: 10px 0;
+        font-weight: bold;
+    }
+    
+    QPushButton#enhance_primary, QPushButton#analyze {
+        color: white;
+        font-weight: bold;
+        padding: 10px;
+    }
+    
+    QPushButton#enhance_primary {
+        background-color: #2196F3;
+    }
+    
+    QPushButton#analyze {
+        background-color: #FF9800;
+    }
+    
+    QLabel#status_ok {
+        color: #4CAF50;
+        font-size: 11px;
+        font-weight: bold;
+    }
+    
+    QLabel#image_label {
+        color: #999;
+    }
+"""
+
+
 def setup_styles(app):
     """Zastosuj stylesheet do aplikacji"""
     app.setStyleSheet(DARK_STYLESHEET)
\ No newline at end of file
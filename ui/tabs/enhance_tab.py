@@ -19,17 +19,39 @@ INSTRUKCJA:
 """
 
 import logging
+import os
+import stat
 from pathlib import Path
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QPushButton,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QPushButton,
     QSlider, QFileDialog, QProgressBar, QComboBox, QMessageBox, QTabWidget
 )
-from PyQt5.QtCore import Qt, pyqtSlot
-from workers.enhancement_worker import EnhancementWorker
+from PyQt5.QtCore import Qt, QTimer, QThreadPool, pyqtSlot
+from PyQt5.QtGui import QTextCursor
+from ui.styles import ENHANCE_TAB_STYLESHEET
+from workers.enhancement_worker import EnhancementWorker, EnhancementRunnable
 from workers.image_analysis_worker import ImageAnalysisWorker
 
 logger = logging.getLogger(__name__)
 
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".gif")
+
+WITH_IMAGE_TAB_INDEX = 1
+WITH_IMAGE_TAB_TITLE = "🖼️ Z obrazem"
+
+# (etykieta w combo, wartość przekazywana do workera)
+DETAIL_LEVEL_ITEMS = [("🟢 Niski", "Niski"), ("🟡 Średni", "Średni"), ("🔴 Wysoki", "Wysoki")]
+STYLE_ITEMS = [
+    ("🎬 Kinematograficzny", "Kinematograficzny"),
+    ("🎨 Artystyczny", "Artystyczny"),
+    ("⚙️ Techniczny", "Techniczny"),
+]
+
+
+def _word_count(text: str) -> int:
+    """Szybkie liczenie słów bez alokacji listy (separator: spacja)"""
+    return text.count(" ") + bool(text)
+
 
 class EnhanceTab(QWidget):
     """Główny tab do wzbogacania promptów"""
@@ -38,9 +60,34 @@ class EnhanceTab(QWidget):
         super().__init__()
         self.current_image_path = None
         self.image_analysis = None
-        self.enhancement_worker = None
         self.image_worker = None
         
+        # Jeden worker na cały tab (sygnały podłączone raz), uruchamiany w puli
+        self._pool = QThreadPool.globalInstance()
+        self._busy = False
+        self._on_worker_done = None
+        # Parametry ostatniego żądania - ponowny klik z tymi samymi
+        # ustawieniami prosi o nową wariację zamiast wyniku z cache
+        self._last_params = None
+        self.enhancement_worker = EnhancementWorker()
+        self.enhancement_worker.progress.connect(self._on_enhancement_progress)
+        self.enhancement_worker.partial_reset.connect(self._on_partial_reset)
+        self.enhancement_worker.partial_en.connect(self._on_partial_en)
+        self.enhancement_worker.partial_pl.connect(self._on_partial_pl)
+        self.enhancement_worker.finished.connect(self._on_worker_finished)
+        # cancel() also closes the session, aborting an in-flight generation
+        QApplication.instance().aboutToQuit.connect(self.enhancement_worker.cancel)
+        self._with_image_built = False
+        
+        self._stream_cursors = None
+        
+        # Debounce etykiet sliderów – max jeden repaint na ~16 ms
+        self._pending_slider_labels = {}
+        self._slider_timer = QTimer(self)
+        self._slider_timer.setSingleShot(True)
+        self._slider_timer.setInterval(16)
+        self._slider_timer.timeout.connect(self._flush_slider_labels)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -49,16 +96,34 @@ class EnhanceTab(QWidget):
         main_layout = QVBoxLayout()
         
         # Dwa sub-taby
-        mode_tabs = QTabWidget()
+        self.mode_tabs = QTabWidget()
         
         direct_widget = self._build_direct_tab()
-        mode_tabs.addTab(direct_widget, "⚡ Bezpośrednie")
+        self.mode_tabs.addTab(direct_widget, "⚡ Bezpośrednie")
         
-        with_image_widget = self._build_with_image_tab()
-        mode_tabs.addTab(with_image_widget, "🖼️ Z obrazem")
+        # "Z obrazem" budowany leniwie przy pierwszym wyborze zakładki
+        self.mode_tabs.addTab(QWidget(), WITH_IMAGE_TAB_TITLE)
+        self.mode_tabs.currentChanged.connect(self._lazy_build_with_image)
         
-        main_layout.addWidget(mode_tabs)
+        main_layout.addWidget(self.mode_tabs)
         self.setLayout(main_layout)
+        
+        # Jeden arkusz stylów dla całego taba zamiast setStyleSheet per widget
+        self.setStyleSheet(ENHANCE_TAB_STYLESHEET)
+    
+    @pyqtSlot(int)
+    def _lazy_build_with_image(self, index: int):
+        """Podmień placeholder na pełny tab "Z obrazem" (tylko raz)"""
+        if index != WITH_IMAGE_TAB_INDEX or self._with_image_built:
+            return
+        self._with_image_built = True
+        
+        placeholder = self.mode_tabs.widget(WITH_IMAGE_TAB_INDEX)
+        with_image_widget = self._build_with_image_tab()
+        self.mode_tabs.removeTab(WITH_IMAGE_TAB_INDEX)
+        self.mode_tabs.insertTab(WITH_IMAGE_TAB_INDEX, with_image_widget, WITH_IMAGE_TAB_TITLE)
+        self.mode_tabs.setCurrentIndex(WITH_IMAGE_TAB_INDEX)
+        placeholder.deleteLater()
     
     # ─────────────────────────────────────────────────────────────────────
     # TAB 1: BEZPOŚREDNIE
@@ -75,7 +140,7 @@ class EnhanceTab(QWidget):
             "System automatycznie rozwijać będzie szczegóły i detale.\n"
             "WAŻNE: Ustaw pełną długość (300-500 słów) i wysoki poziom detali!"
         )
-        info.setStyleSheet("color: #FF9800; font-size: 11px; margin: 10px 0; font-weight: bold;")
+        info.setObjectName("info")
         layout.addWidget(info)
         
         # PROMPT INPUT
@@ -106,6 +171,8 @@ class EnhanceTab(QWidget):
         self.direct_creativity.setMaximum(100)
         self.direct_creativity.setValue(80)
         self.direct_creativity.setMaximumWidth(150)
+        self.direct_creativity.setTracking(False)
+        self.direct_creativity.valueChanged.connect(self._on_direct_creativity_changed)
         self.direct_creativity.sliderMoved.connect(self._on_direct_creativity_changed)
         settings_layout1.addWidget(self.direct_creativity)
         
@@ -126,6 +193,8 @@ class EnhanceTab(QWidget):
         self.direct_word_count.setValue(350)
         self.direct_word_count.setSingleStep(50)
         self.direct_word_count.setMaximumWidth(150)
+        self.direct_word_count.setTracking(False)
+        self.direct_word_count.valueChanged.connect(self._on_direct_word_count_changed)
         self.direct_word_count.sliderMoved.connect(self._on_direct_word_count_changed)
         settings_layout2.addWidget(self.direct_word_count)
         
@@ -137,7 +206,8 @@ class EnhanceTab(QWidget):
         
         settings_layout2.addWidget(QLabel("📊 Poziom detali:"))
         self.direct_detail_level = QComboBox()
-        self.direct_detail_level.addItems(["🟢 Niski", "🟡 Średni", "🔴 Wysoki"])
+        for label, key in DETAIL_LEVEL_ITEMS:
+            self.direct_detail_level.addItem(label, key)
         self.direct_detail_level.setCurrentIndex(2)
         self.direct_detail_level.setMaximumWidth(140)
         settings_layout2.addWidget(self.direct_detail_level)
@@ -150,7 +220,8 @@ class EnhanceTab(QWidget):
         
         settings_layout3.addWidget(QLabel("🎨 Styl opisu:"))
         self.direct_style = QComboBox()
-        self.direct_style.addItems(["🎬 Kinematograficzny", "🎨 Artystyczny", "⚙️ Techniczny"])
+        for label, key in STYLE_ITEMS:
+            self.direct_style.addItem(label, key)
         self.direct_style.setCurrentIndex(0)
         self.direct_style.setMaximumWidth(200)
         settings_layout3.addWidget(self.direct_style)
@@ -162,9 +233,7 @@ class EnhanceTab(QWidget):
         action_layout = QHBoxLayout()
         
         self.direct_enhance_btn = QPushButton("✨ Wzbogać prompt (może potrwać 30-60 sek)")
-        self.direct_enhance_btn.setStyleSheet(
-            "background-color: #2196F3; color: white; font-weight: bold; padding: 10px;"
-        )
+        self.direct_enhance_btn.setObjectName("enhance_primary")
         self.direct_enhance_btn.clicked.connect(self._on_direct_enhance)
         action_layout.addWidget(self.direct_enhance_btn)
         
@@ -180,7 +249,7 @@ class EnhanceTab(QWidget):
         layout.addWidget(self.direct_progress)
         
         self.direct_status = QLabel("✅ Gotowy")
-        self.direct_status.setStyleSheet("color: #4CAF50; font-size: 11px; font-weight: bold;")
+        self.direct_status.setObjectName("status_ok")
         layout.addWidget(self.direct_status)
         
         # WYNIKI
@@ -192,6 +261,7 @@ class EnhanceTab(QWidget):
         en_layout.addWidget(QLabel("🇬🇧 English:"))
         self.direct_result_en = QTextEdit()
         self.direct_result_en.setReadOnly(True)
+        self.direct_result_en.setAcceptRichText(False)
         self.direct_result_en.setMinimumHeight(120)
         en_layout.addWidget(self.direct_result_en)
         results_layout.addLayout(en_layout)
@@ -200,6 +270,7 @@ class EnhanceTab(QWidget):
         pl_layout.addWidget(QLabel("🇵🇱 Polski:"))
         self.direct_result_pl = QTextEdit()
         self.direct_result_pl.setReadOnly(True)
+        self.direct_result_pl.setAcceptRichText(False)
         self.direct_result_pl.setMinimumHeight(120)
         pl_layout.addWidget(self.direct_result_pl)
         results_layout.addLayout(pl_layout)
@@ -238,7 +309,7 @@ class EnhanceTab(QWidget):
             "📸 Załaduj obraz i wzbogacz prompt w kontekście jego zawartości.\n"
             "System przeanalizuje obraz i dostosuje szczegóły do wizualnych elementów."
         )
-        info.setStyleSheet("color: #FF9800; font-size: 11px; margin: 10px 0; font-weight: bold;")
+        info.setObjectName("info")
         layout.addWidget(info)
         
         # WCZYTYWANIE OBRAZU
@@ -251,7 +322,7 @@ class EnhanceTab(QWidget):
         image_layout.addWidget(self.with_image_select_btn)
         
         self.with_image_label = QLabel("Brak obrazu")
-        self.with_image_label.setStyleSheet("color: #999;")
+        self.with_image_label.setObjectName("image_label")
         image_layout.addWidget(self.with_image_label)
         
         image_layout.addStretch()
@@ -284,6 +355,8 @@ class EnhanceTab(QWidget):
         self.with_image_creativity.setMaximum(100)
         self.with_image_creativity.setValue(80)
         self.with_image_creativity.setMaximumWidth(150)
+        self.with_image_creativity.setTracking(False)
+        self.with_image_creativity.valueChanged.connect(self._on_with_image_creativity_changed)
         self.with_image_creativity.sliderMoved.connect(self._on_with_image_creativity_changed)
         settings_layout1.addWidget(self.with_image_creativity)
         
@@ -304,6 +377,8 @@ class EnhanceTab(QWidget):
         self.with_image_word_count.setValue(350)
         self.with_image_word_count.setSingleStep(50)
         self.with_image_word_count.setMaximumWidth(150)
+        self.with_image_word_count.setTracking(False)
+        self.with_image_word_count.valueChanged.connect(self._on_with_image_word_count_changed)
         self.with_image_word_count.sliderMoved.connect(self._on_with_image_word_count_changed)
         settings_layout2.addWidget(self.with_image_word_count)
         
@@ -315,7 +390,8 @@ class EnhanceTab(QWidget):
         
         settings_layout2.addWidget(QLabel("📊 Detale:"))
         self.with_image_detail_level = QComboBox()
-        self.with_image_detail_level.addItems(["🟢 Niski", "🟡 Średni", "🔴 Wysoki"])
+        for label, key in DETAIL_LEVEL_ITEMS:
+            self.with_image_detail_level.addItem(label, key)
         self.with_image_detail_level.setCurrentIndex(2)
         self.with_image_detail_level.setMaximumWidth(140)
         settings_layout2.addWidget(self.with_image_detail_level)
@@ -328,7 +404,8 @@ class EnhanceTab(QWidget):
         
         settings_layout3.addWidget(QLabel("🎨 Styl:"))
         self.with_image_style = QComboBox()
-        self.with_image_style.addItems(["🎬 Kinematograficzny", "🎨 Artystyczny", "⚙️ Techniczny"])
+        for label, key in STYLE_ITEMS:
+            self.with_image_style.addItem(label, key)
         self.with_image_style.setCurrentIndex(0)
         self.with_image_style.setMaximumWidth(200)
         settings_layout3.addWidget(self.with_image_style)
@@ -340,16 +417,12 @@ class EnhanceTab(QWidget):
         action_layout = QHBoxLayout()
         
         self.with_image_analyze_btn = QPushButton("🔍 Analizuj obraz")
-        self.with_image_analyze_btn.setStyleSheet(
-            "background-color: #FF9800; color: white; font-weight: bold; padding: 10px;"
-        )
+        self.with_image_analyze_btn.setObjectName("analyze")
         self.with_image_analyze_btn.clicked.connect(self._on_with_image_analyze)
         action_layout.addWidget(self.with_image_analyze_btn)
         
         self.with_image_enhance_btn = QPushButton("✨ Wzbogać")
-        self.with_image_enhance_btn.setStyleSheet(
-            "background-color: #2196F3; color: white; font-weight: bold; padding: 10px;"
-        )
+        self.with_image_enhance_btn.setObjectName("enhance_primary")
         self.with_image_enhance_btn.clicked.connect(self._on_with_image_enhance)
         self.with_image_enhance_btn.setEnabled(False)
         action_layout.addWidget(self.with_image_enhance_btn)
@@ -362,7 +435,7 @@ class EnhanceTab(QWidget):
         layout.addWidget(self.with_image_progress)
         
         self.with_image_status = QLabel("✅ Gotowy")
-        self.with_image_status.setStyleSheet("color: #4CAF50; font-size: 11px; font-weight: bold;")
+        self.with_image_status.setObjectName("status_ok")
         layout.addWidget(self.with_image_status)
         
         # WYNIKI
@@ -374,6 +447,7 @@ class EnhanceTab(QWidget):
         en_layout.addWidget(QLabel("🇬🇧 English:"))
         self.with_image_result_en = QTextEdit()
         self.with_image_result_en.setReadOnly(True)
+        self.with_image_result_en.setAcceptRichText(False)
         self.with_image_result_en.setMinimumHeight(120)
         en_layout.addWidget(self.with_image_result_en)
         results_layout.addLayout(en_layout)
@@ -382,6 +456,7 @@ class EnhanceTab(QWidget):
         pl_layout.addWidget(QLabel("🇵🇱 Polski:"))
         self.with_image_result_pl = QTextEdit()
         self.with_image_result_pl.setReadOnly(True)
+        self.with_image_result_pl.setAcceptRichText(False)
         self.with_image_result_pl.setMinimumHeight(120)
         pl_layout.addWidget(self.with_image_result_pl)
         results_layout.addLayout(pl_layout)
@@ -414,6 +489,9 @@ class EnhanceTab(QWidget):
     def _on_direct_enhance(self):
         """Uruchom wzbogacanie"""
         
+        if self._busy:
+            return
+        
         prompt = self.direct_prompt_input.toPlainText().strip()
         if not prompt:
             QMessageBox.warning(self, "Błąd", "Wpisz prompt!")
@@ -423,30 +501,26 @@ class EnhanceTab(QWidget):
         creativity = self.direct_creativity.value() / 100.0
         word_count = self.direct_word_count.value()
         
-        detail_map = {"Niski": "low", "Średni": "medium", "Wysoki": "high"}
-        detail_text = self.direct_detail_level.currentText()
-        detail_level = detail_map.get(detail_text.split()[-1], "medium")
-        
-        style_map = {"Kinematograficzny": "cinematic", "Artystyczny": "artistic", "Techniczny": "technical"}
-        style_text = self.direct_style.currentText()
-        style = style_map.get(style_text.split()[-1], "cinematic")
+        detail_level = self.direct_detail_level.currentData()
+        style = self.direct_style.currentData()
         
         self.direct_enhance_btn.setEnabled(False)
         self.direct_progress.setVisible(True)
         self.direct_progress.setValue(0)
         self.direct_status.setText("🔄 Wzbogacanie... (ETAP 1: ekspansja, ETAP 2: generacja, ETAP 3: validacja)")
         
-        self.enhancement_worker = EnhancementWorker(
-            prompt=prompt,
-            language=language,
-            creativity=creativity,
-            word_count=word_count,
-            detail_level=detail_level,
-            style=style
+        self._start_enhancement(
+            dict(
+                prompt=prompt,
+                creativity=creativity,
+                length=word_count,
+                details=detail_level,
+                style=style
+            ),
+            self.direct_result_en,
+            self.direct_result_pl,
+            self._on_enhancement_finished
         )
-        self.enhancement_worker.progress.connect(self._on_enhancement_progress)
-        self.enhancement_worker.finished.connect(self._on_enhancement_finished)
-        self.enhancement_worker.start()
     
     @pyqtSlot()
     def _on_direct_clear(self):
@@ -456,37 +530,21 @@ class EnhanceTab(QWidget):
         self.direct_result_pl.clear()
         self.direct_status.setText("✅ Gotowy")
     
-    @pyqtSlot()
-    def _on_direct_word_count_changed(self):
-        val = self.direct_word_count.value()
-        self.direct_word_count_label.setText(f"{val} słów")
+    @pyqtSlot(int)
+    def _on_direct_word_count_changed(self, val: int):
+        self._schedule_slider_label(self.direct_word_count_label, f"{val} słów")
     
-    @pyqtSlot()
-    def _on_direct_creativity_changed(self):
-        val = self.direct_creativity.value() / 100.0
-        self.direct_creativity_label.setText(f"{val:.2f}")
+    @pyqtSlot(int)
+    def _on_direct_creativity_changed(self, val: int):
+        self._schedule_slider_label(self.direct_creativity_label, f"{val / 100.0:.2f}")
     
     @pyqtSlot()
     def _copy_direct_en(self):
-        try:
-            import pyperclip
-            text = self.direct_result_en.toPlainText()
-            if text:
-                pyperclip.copy(text)
-                QMessageBox.information(self, "OK", "Skopiowano EN!")
-        except:
-            QMessageBox.warning(self, "Błąd", "Nie udało się skopiować")
+        self._copy_to_clipboard(self.direct_result_en, self.direct_status, "EN")
     
     @pyqtSlot()
     def _copy_direct_pl(self):
-        try:
-            import pyperclip
-            text = self.direct_result_pl.toPlainText()
-            if text:
-                pyperclip.copy(text)
-                QMessageBox.information(self, "OK", "Skopiowano PL!")
-        except:
-            QMessageBox.warning(self, "Błąd", "Nie udało się skopiować")
+        self._copy_to_clipboard(self.direct_result_pl, self.direct_status, "PL")
     
     # ─────────────────────────────────────────────────────────────────────
     # SLOTY: Z OBRAZEM
@@ -502,6 +560,7 @@ class EnhanceTab(QWidget):
         )
         
         if file_path:
+            self._cancel_image_worker()
             self.current_image_path = file_path
             self.with_image_label.setText(Path(file_path).name)
             self.with_image_label.setStyleSheet("color: #4CAF50;")
@@ -513,18 +572,47 @@ class EnhanceTab(QWidget):
             QMessageBox.warning(self, "Błąd", "Wybierz obraz!")
             return
         
+        # Tania walidacja w wątku UI – złe pliki odrzucamy bez startu workera
+        if not self.current_image_path.lower().endswith(IMAGE_EXTENSIONS):
+            QMessageBox.warning(self, "Błąd", "Nieobsługiwany format obrazu!")
+            return
+        try:
+            st = os.stat(self.current_image_path)
+        except OSError as e:
+            QMessageBox.warning(self, "Błąd", f"Nie można odczytać pliku:\n{e}")
+            return
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            QMessageBox.warning(self, "Błąd", "Plik obrazu jest pusty lub nieprawidłowy!")
+            return
+        
         self.with_image_analyze_btn.setEnabled(False)
         self.with_image_progress.setVisible(True)
         self.with_image_progress.setValue(50)
         self.with_image_status.setText("🔄 Analiza...")
         
+        self._cancel_image_worker()
         self.image_worker = ImageAnalysisWorker(self.current_image_path)
         self.image_worker.progress.connect(self._on_image_analysis_progress)
         self.image_worker.finished.connect(self._on_image_analysis_finished)
         self.image_worker.start()
     
+    def _cancel_image_worker(self):
+        """Porzuć trwającą analizę poprzedniego obrazu (bez jej wyniku w UI)"""
+        if self.image_worker is None:
+            return
+        self.image_worker.cancel()
+        try:
+            self.image_worker.progress.disconnect()
+            self.image_worker.finished.disconnect()
+        except TypeError:
+            pass
+        self.image_worker = None
+    
     @pyqtSlot()
     def _on_with_image_enhance(self):
+        if self._busy:
+            return
+        
         prompt = self.with_image_prompt_input.toPlainText().strip()
         if not prompt:
             QMessageBox.warning(self, "Błąd", "Wpisz prompt!")
@@ -534,74 +622,160 @@ class EnhanceTab(QWidget):
         creativity = self.with_image_creativity.value() / 100.0
         word_count = self.with_image_word_count.value()
         
-        detail_map = {"Niski": "low", "Średni": "medium", "Wysoki": "high"}
-        detail_text = self.with_image_detail_level.currentText()
-        detail_level = detail_map.get(detail_text.split()[-1], "medium")
-        
-        style_map = {"Kinematograficzny": "cinematic", "Artystyczny": "artistic", "Techniczny": "technical"}
-        style_text = self.with_image_style.currentText()
-        style = style_map.get(style_text.split()[-1], "cinematic")
+        detail_level = self.with_image_detail_level.currentData()
+        style = self.with_image_style.currentData()
         
         self.with_image_enhance_btn.setEnabled(False)
         self.with_image_progress.setVisible(True)
         self.with_image_progress.setValue(0)
         self.with_image_status.setText("🔄 Wzbogacanie...")
         
-        self.enhancement_worker = EnhancementWorker(
-            prompt=prompt,
-            language=language,
-            creativity=creativity,
-            image_analysis=self.image_analysis,
-            word_count=word_count,
-            detail_level=detail_level,
-            style=style
+        self._start_enhancement(
+            dict(
+                prompt=prompt,
+                creativity=creativity,
+                length=word_count,
+                details=detail_level,
+                style=style,
+                image_analysis=self.image_analysis
+            ),
+            self.with_image_result_en,
+            self.with_image_result_pl,
+            self._on_with_image_enhancement_finished
         )
-        self.enhancement_worker.progress.connect(self._on_enhancement_progress)
-        self.enhancement_worker.finished.connect(self._on_with_image_enhancement_finished)
-        self.enhancement_worker.start()
     
-    @pyqtSlot()
-    def _on_with_image_word_count_changed(self):
-        val = self.with_image_word_count.value()
-        self.with_image_word_count_label.setText(f"{val} słów")
+    @pyqtSlot(int)
+    def _on_with_image_word_count_changed(self, val: int):
+        self._schedule_slider_label(self.with_image_word_count_label, f"{val} słów")
     
-    @pyqtSlot()
-    def _on_with_image_creativity_changed(self):
-        val = self.with_image_creativity.value() / 100.0
-        self.with_image_creativity_label.setText(f"{val:.2f}")
+    @pyqtSlot(int)
+    def _on_with_image_creativity_changed(self, val: int):
+        self._schedule_slider_label(self.with_image_creativity_label, f"{val / 100.0:.2f}")
     
     @pyqtSlot()
     def _copy_with_image_en(self):
-        try:
-            import pyperclip
-            text = self.with_image_result_en.toPlainText()
-            if text:
-                pyperclip.copy(text)
-                QMessageBox.information(self, "OK", "Skopiowano EN!")
-        except:
-            QMessageBox.warning(self, "Błąd", "Nie udało się skopiować")
+        self._copy_to_clipboard(self.with_image_result_en, self.with_image_status, "EN")
     
     @pyqtSlot()
     def _copy_with_image_pl(self):
+        self._copy_to_clipboard(self.with_image_result_pl, self.with_image_status, "PL")
+    
+    # ─────────────────────────────────────────────────────────────────────
+    # ZLECANIE WZBOGACANIA W PULI WĄTKÓW
+    # ─────────────────────────────────────────────────────────────────────
+    
+    def _start_enhancement(self, params: dict, en_edit: QTextEdit, pl_edit: QTextEdit, on_done):
+        """Zleć wzbogacanie w QThreadPool (bez tworzenia nowego wątku)"""
+        self._busy = True
+        self._on_worker_done = on_done
+        repeat = params == self._last_params
+        self._last_params = dict(params)
+        if repeat:
+            params["regenerate"] = True
+        self._attach_stream(en_edit, pl_edit)
+        self._pool.start(EnhancementRunnable(self.enhancement_worker, params))
+    
+    @pyqtSlot(bool, dict)
+    def _on_worker_finished(self, success: bool, result: dict):
+        """Przekaż wynik do slotu trybu, który zlecił żądanie"""
+        self._busy = False
+        on_done, self._on_worker_done = self._on_worker_done, None
+        if on_done is not None:
+            on_done(success, result)
+    
+    # ─────────────────────────────────────────────────────────────────────
+    # STREAMING WYNIKÓW
+    # ─────────────────────────────────────────────────────────────────────
+    
+    def _attach_stream(self, en_edit: QTextEdit, pl_edit: QTextEdit):
+        """
+        Skieruj częściowe wyniki workera do pól EN/PL
+        
+        Jeden trwały QTextCursor na pole – każdy fragment to insertText
+        na końcu (O(fragment)), bez toPlainText()/setPlainText() w pętli.
+        """
+        self._stream_cursors = (QTextCursor(en_edit.document()), QTextCursor(pl_edit.document()))
+        self._on_partial_reset()
+    
+    @pyqtSlot()
+    def _on_partial_reset(self):
+        """Nowa próba (retry) – zacznij od pustych pól"""
+        if self._stream_cursors is None:
+            return
+        for cursor in self._stream_cursors:
+            cursor.document().clear()
+            cursor.movePosition(QTextCursor.End)
+    
+    @pyqtSlot(str)
+    def _on_partial_en(self, text: str):
+        if self._stream_cursors is not None:
+            self._stream_cursors[0].insertText(text)
+    
+    @pyqtSlot(str)
+    def _on_partial_pl(self, text: str):
+        if self._stream_cursors is not None:
+            self._stream_cursors[1].insertText(text)
+    
+    # ─────────────────────────────────────────────────────────────────────
+    # SCHOWEK
+    # ─────────────────────────────────────────────────────────────────────
+    
+    def _copy_to_clipboard(self, source: QTextEdit, status: QLabel, lang: str):
+        """Skopiuj wynik do schowka Qt (in-process, bez xclip/xsel)"""
+        text = source.toPlainText()
+        if text:
+            # Zapis do schowka po powrocie z handlera kliknięcia
+            QTimer.singleShot(0, lambda t=text: self._set_clipboard_text(t, status, lang))
+    
+    def _set_clipboard_text(self, text: str, status: QLabel, lang: str):
+        """Właściwy zapis do schowka (wywoływany z pętli zdarzeń)"""
         try:
-            import pyperclip
-            text = self.with_image_result_pl.toPlainText()
-            if text:
-                pyperclip.copy(text)
-                QMessageBox.information(self, "OK", "Skopiowano PL!")
-        except:
+            QApplication.clipboard().setText(text)
+            # Nieblokujący "toast" w etykiecie statusu zamiast modalnego okna
+            toast = f"📋 Skopiowano {lang}!"
+            status.setText(toast)
+            QTimer.singleShot(2000, lambda: self._clear_toast(status, toast))
+        except Exception as e:
+            logger.error(f"Błąd kopiowania do schowka: {e}")
             QMessageBox.warning(self, "Błąd", "Nie udało się skopiować")
     
+    def _clear_toast(self, status: QLabel, toast: str):
+        """Przywróć status, o ile nikt go w międzyczasie nie nadpisał"""
+        if status.text() == toast:
+            status.setText("✅ Gotowy")
+    
+    # ─────────────────────────────────────────────────────────────────────
+    # SLIDERY: DEBOUNCE ETYKIET
+    # ─────────────────────────────────────────────────────────────────────
+    
+    def _schedule_slider_label(self, label: QLabel, text: str):
+        """Zapamiętaj nowy tekst etykiety i odłóż repaint do timera"""
+        self._pending_slider_labels[label] = text
+        if not self._slider_timer.isActive():
+            self._slider_timer.start()
+    
+    @pyqtSlot()
+    def _flush_slider_labels(self):
+        """Zapisz wszystkie zmienione etykiety za jednym razem"""
+        pending = self._pending_slider_labels
+        self._pending_slider_labels = {}
+        for label, text in pending.items():
+            label.setText(text)
+    
     # ─────────────────────────────────────────────────────────────────────
     # CALLBACKS
     # ─────────────────────────────────────────────────────────────────────
     
-    @pyqtSlot(str)
-    def _on_enhancement_progress(self, msg: str):
+    @pyqtSlot(object)
+    def _on_enhancement_progress(self, update: dict):
+        msg = update.get('message')
+        if msg is None:
+            return
         self.direct_status.setText(msg)
-        self.with_image_status.setText(msg)
         self.direct_progress.setValue(min(99, self.direct_progress.value() + 20))
-        self.with_image_progress.setValue(min(99, self.with_image_progress.value() + 20))
+        if self._with_image_built:
+            self.with_image_status.setText(msg)
+            self.with_image_progress.setValue(min(99, self.with_image_progress.value() + 20))
     
     @pyqtSlot(bool, dict)
     def _on_enhancement_finished(self, success: bool, result: dict):
@@ -609,10 +783,10 @@ class EnhanceTab(QWidget):
         self.direct_progress.setVisible(False)
         
         if success:
-            self.direct_result_en.setText(result.get("prompt_en", ""))
-            self.direct_result_pl.setText(result.get("prompt_pl", ""))
-            en_words = len(result.get("prompt_en", "").split())
-            pl_words = len(result.get("prompt_pl", "").split())
+            self.direct_result_en.setPlainText(result.get("prompt_en", ""))
+            self.direct_result_pl.setPlainText(result.get("prompt_pl", ""))
+            en_words = _word_count(result.get("prompt_en", ""))
+            pl_words = _word_count(result.get("prompt_pl", ""))
             self.direct_status.setText(
                 f"✅ Gotowe! EN: {en_words} słów, PL: {pl_words} słów"
             )
@@ -627,10 +801,10 @@ class EnhanceTab(QWidget):
         self.with_image_progress.setVisible(False)
         
         if success:
-            self.with_image_result_en.setText(result.get("prompt_en", ""))
-            self.with_image_result_pl.setText(result.get("prompt_pl", ""))
-            en_words = len(result.get("prompt_en", "").split())
-            pl_words = len(result.get("prompt_pl", "").split())
+            self.with_image_result_en.setPlainText(result.get("prompt_en", ""))
+            self.with_image_result_pl.setPlainText(result.get("prompt_pl", ""))
+            en_words = _word_count(result.get("prompt_en", ""))
+            pl_words = _word_count(result.get("prompt_pl", ""))
             self.with_image_status.setText(
                 f"✅ Gotowe! EN: {en_words} słów, PL: {pl_words} słów"
             )
@@ -4,9 +4,19 @@ Bezpieczne obsługiwanie JSON (NumPy types)
 """
 
 import json
+import json.encoder
 import numpy as np
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Współdzielony dekoder – json.loads tworzy nowy przy każdym wywołaniu
+_DECODER = json.JSONDecoder()
+
 
 class SafeJSONEncoder(json.JSONEncoder):
     """Encoder dla NumPy i innych specjalnych typów"""
@@ -25,14 +35,73 @@ class SafeJSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
-def safe_dumps(obj, **kwargs) -> str:
-    """JSON.dumps ze zmiękczeniem typów NumPy"""
-    return json.dumps(obj, cls=SafeJSONEncoder, ensure_ascii=False, **kwargs)
+def _orjson_float(o: float) -> str:
+    """
+    Zapis floata identyczny z orjson
+
+    repr() Pythona przechodzi na notację wykładniczą już poniżej 1e-4
+    i dopisuje '+' oraz zera w wykładniku (1e+20, 1e-07); orjson robi to
+    dopiero poniżej 1e-5 (1e20, 1e-7). NaN/Infinity orjson zapisuje jako null.
+    """
+    if o != o or o in (float("inf"), float("-inf")):
+        return "null"
+    text = float.__repr__(o)
+    if "e" not in text:
+        return text
+    mantissa, exponent = text.split("e")
+    exponent = int(exponent)
+    if exponent != -5:
+        return f"{mantissa}e{exponent}"
+    sign = "-" if mantissa.startswith("-") else ""
+    digits = mantissa.lstrip("-").replace(".", "")
+    return f"{sign}0.0000{digits}"
+
+
+class _CanonicalEncoder(SafeJSONEncoder):
+    """Zapasowa ścieżka safe_dumps – bajt w bajt to samo co orjson"""
+
+    def iterencode(self, o, _one_shot=False):
+        # Enkoder w C ignoruje floatstr, więc zawsze wersja w Pythonie
+        encoder = json.encoder.encode_basestring
+        return json.encoder._make_iterencode(
+            {} if self.check_circular else None, self.default, encoder,
+            self.indent, _orjson_float, self.key_separator,
+            self.item_separator, self.sort_keys, self.skipkeys, _one_shot,
+        )(o, 0)
+
+
+# Typy NumPy idą przez ten sam default co w ścieżce zapasowej – natywne
+# OPT_SERIALIZE_NUMPY zapisuje float32 inaczej (0.7 zamiast 0.699999988…)
+_orjson_default = SafeJSONEncoder().default
+
+
+def safe_dumps(obj, sort_keys: bool = True, **kwargs) -> str:
+    """
+    JSON.dumps ze zmiękczeniem typów NumPy
+
+    Domyślnie deterministycznie: posortowane klucze i zwarte separatory
+    (bez spacji). Celowo – wynik służy jako klucz cache i treść promptów,
+    więc ten sam obiekt musi dawać identyczne bajty – także bez orjson.
+    """
+    if kwargs:
+        if kwargs.get("indent") is None:
+            kwargs.setdefault("separators", (",", ":"))
+        return json.dumps(obj, cls=SafeJSONEncoder, ensure_ascii=False, sort_keys=sort_keys, **kwargs)
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=_orjson_default, option=option).decode()
+        except TypeError:
+            pass  # np. int spoza 64 bitów – zapasowa ścieżka da ten sam zapis
+    return json.dumps(obj, cls=_CanonicalEncoder, ensure_ascii=False,
+                      sort_keys=sort_keys, separators=(",", ":"))
 
 
 def safe_loads(s: str) -> dict:
     """Bezpieczne wczytanie JSON"""
     try:
-        return json.loads(s)
+        return _DECODER.decode(s)
     except json.JSONDecodeError as e:
         raise ValueError(f"Błąd parsowania JSON: {e}")
\ No newline at end of file
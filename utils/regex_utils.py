@@ -3,50 +3,124 @@ utils/regex_utils.py
 Regex utilities dla wyciągania JSON
 """
 
-import re
 import json
-from typing import Dict, Optional
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Jeden dekoder na moduł zamiast nowego przy każdym json.loads
+_DECODER = json.JSONDecoder()
 
-def extract_json_from_response(response: str) -> Dict:
+# Limit prób dekodowania - każda kosztuje O(długość kandydata),
+# więc cała ekstrakcja pozostaje liniowa także dla śmieci pełnych klamer
+_MAX_DECODE_ATTEMPTS = 32
+
+# (start, koniec, zagnieżdżone kandydaty)
+_Span = Tuple[int, int, list]
+
+
+def _scan_json_objects(s: str) -> List[_Span]:
     """
-    Wyciągnij JSON z outputu modelu LLM
+    Jednoprzebiegowy skaner nawiasów klamrowych
     
-    Próbuje różne strategie w kolejności:
-    1. Dokładny JSON (prompt_en + prompt_pl)
-    2. Słabszy regex
-    3. Fallback raw response
+    Zwraca zrównoważone obiekty {...} najwyższego poziomu wraz
+    z zagnieżdżonymi, pomijając klamry wewnątrz stringów JSON.
+    Klamra bez domknięcia (np. "oops { ... {...}") nie jest kandydatem,
+    ale obiekty w jej wnętrzu tak. Bez backtrackingu - O(n).
     """
+    roots: List[_Span] = []
+    stack: List[Tuple[int, list]] = []
+    in_string = False
+    escaped = False
     
-    patterns = [
-        # Dokładny JSON
-        r'\{[^{}]*"prompt_en"[^{}]*"prompt_pl"[^{}]*\}',
-        r'\{[^{}]*"prompt_pl"[^{}]*"prompt_en"[^{}]*\}',
-        # Słabszy
-        r'\{.*?"prompt_en".*?"prompt_pl".*?\}',
-        r'\{.*?"prompt_pl".*?"prompt_en".*?\}',
-        # Desperacja
-        r'\{.*\}',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, response, re.DOTALL)
-        if match:
-            try:
-                data = json.loads(match.group())
-                if "prompt_en" in data and "prompt_pl" in data:
-                    logger.debug(f"✅ JSON extracted with pattern: {pattern[:30]}...")
-                    return data
-            except json.JSONDecodeError:
-                continue
+    for i, ch in enumerate(s):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '{':
+            stack.append((i, []))
+        elif stack:
+            if ch == '"':
+                in_string = True
+            elif ch == '}':
+                start, children = stack.pop()
+                (stack[-1][1] if stack else roots).append((start, i + 1, children))
     
-    # Fallback
+    # Obiekty wewnątrz niedomkniętych klamer awansują na najwyższy poziom
+    for _, children in stack:
+        roots.extend(children)
+    return roots
+
+
+def _find_prompts(data: Any) -> Optional[Dict]:
+    """
+    Pierwszy słownik z prompt_en + prompt_pl
+    
+    Sprawdza sam obiekt, a potem wszerz zagnieżdżone wartości,
+    np. {"result": {"prompt_en": ..., "prompt_pl": ...}}.
+    """
+    queue = [data]
+    for node in queue:
+        if isinstance(node, dict):
+            if "prompt_en" in node and "prompt_pl" in node:
+                return node
+            queue.extend(node.values())
+        elif isinstance(node, list):
+            queue.extend(node)
+    return None
+
+
+def _fallback(response: str) -> Dict:
+    """Surowa odpowiedź w miejsce obu promptów"""
     logger.warning("⚠️ Using fallback raw response")
     return {
         "prompt_en": response[:500],
         "prompt_pl": response[:500],
         "_status": "fallback_raw_response"
-    }
\ No newline at end of file
+    }
+
+
+def extract_json_from_response(response: str) -> Dict:
+    """
+    Wyciągnij JSON z outputu modelu LLM
+    
+    Skanuje odpowiedź raz, dekoduje zrównoważone obiekty {...}
+    (od zewnętrznych; zagnieżdżone tylko gdy zewnętrzny jest uszkodzony)
+    i zwraca pierwszy obiekt lub podobiekt zawierający prompt_en +
+    prompt_pl, w przeciwnym razie fallback raw response.
+    """
+    
+    # Pusta odpowiedź / komunikat błędu bez JSON – od razu fallback
+    if not response or "{" not in response:
+        return _fallback(response or "")
+    
+    # Bez obu kluczy żaden kandydat nie przejdzie walidacji
+    if '"prompt_en"' in response and '"prompt_pl"' in response:
+        candidates = deque(_scan_json_objects(response))
+        attempts = 0
+        while candidates and attempts < _MAX_DECODE_ATTEMPTS:
+            start, end, children = candidates.popleft()
+            # Wycinek zamiast offsetu: błąd dekodowania liczy wiersze
+            # od początku dokumentu, co przy wielu kandydatach daje O(n²)
+            candidate = response[start:end]
+            if '"prompt_en"' not in candidate or '"prompt_pl"' not in candidate:
+                continue
+            attempts += 1
+            try:
+                data = _DECODER.decode(candidate)
+            except (ValueError, RecursionError):
+                # Uszkodzony obiekt - właściwy może być zagnieżdżony
+                candidates.extendleft(reversed(children))
+                continue
+            found = _find_prompts(data)
+            if found is not None:
+                logger.debug(f"✅ JSON extracted ({end - start} chars)")
+                return found
+    
+    return _fallback(response)
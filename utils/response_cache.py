@@ -0,0 +1,153 @@
+"""
+utils/response_cache.py
+Cache odpowiedzi LLM na dysku (SQLite)
+
+Klucz = hash kanonicznej (posortowanej) reprezentacji parametrów,
+więc identyczne żądania zwracają wynik natychmiast zamiast 30-60 s.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from utils.json_utils import safe_dumps, safe_loads
+
+logger = logging.getLogger(__name__)
+
+def quantize(value: float, step: float) -> float:
+    """Zaokrąglij do wielokrotności step (np. kreatywność w kluczu cache)"""
+    return round(round(value / step) * step, 2)
+
+
+class ResponseCache:
+    """Cache udanych wyników wzbogacania (key -> JSON wyniku)"""
+
+    def __init__(self, db_path: Path, ttl: Optional[float] = None):
+        """
+        Args:
+            db_path: Plik bazy SQLite
+            ttl: Wiek (s), po którym wpisy są usuwane z pliku; None = bez limitu
+        """
+        self.db_path = Path(db_path)
+        self.ttl = ttl
+        self._conn = None
+        # Jedno połączenie współdzielone przez wątek UI i wątki puli
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def make_key(**params) -> str:
+        """Stabilny klucz z parametrów żądania"""
+        canonical = safe_dumps(params)
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Leniwe otwarcie bazy (przy pierwszym użyciu)"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS enh_cache ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                "created REAL NOT NULL DEFAULT 0)"
+            )
+            # Baza ze starszej wersji: bez kolumny created (wpisy wygasną od razu)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(enh_cache)")}
+            if "created" not in columns:
+                conn.execute("ALTER TABLE enh_cache ADD COLUMN created REAL NOT NULL DEFAULT 0")
+            conn.execute("CREATE INDEX IF NOT EXISTS enh_cache_created ON enh_cache (created)")
+            self._conn = conn
+            self._prune(conn)
+        return self._conn
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Usuń wpisy starsze niż ttl, żeby plik nie rósł bez końca"""
+        if self.ttl is not None:
+            with conn:
+                conn.execute("DELETE FROM enh_cache WHERE created < ?", (time.time() - self.ttl,))
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Zwróć zapisany wynik albo None"""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT response FROM enh_cache WHERE key=?", (key,)
+                ).fetchone()
+            return safe_loads(row[0]) if row else None
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.warning(f"Cache read failed: {e}")
+            return None
+
+    def put(self, key: str, result: Dict) -> None:
+        """Zapisz wynik (nadpisuje istniejący) i usuń przeterminowane wpisy"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO enh_cache (key, response, created) VALUES (?, ?, ?)",
+                        (key, safe_dumps(result), time.time()),
+                    )
+                self._prune(conn)
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            logger.warning(f"Cache write failed: {e}")
+
+    def close(self) -> None:
+        """Zamknij połączenie z bazą"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class LLMCache:
+    """
+    Cache wyników LLM w pamięci (LRU + TTL) z opcjonalnym zapisem na dysk
+
+    Wpisy to słowniki wyniku; backend (ResponseCache) przechowuje je
+    razem ze znacznikiem czasu, więc TTL działa też po restarcie.
+    """
+
+    def __init__(self, ttl: float, max_entries: int, backend: Optional[ResponseCache] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.backend = backend
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Zwróć świeży wynik albo None"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] < self.ttl:
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+        if self.backend is None:
+            return None
+        stored = self.backend.get(key)
+        # Na dysku czas ścienny (przeżywa restart), w pamięci monotoniczny
+        age = time.time() - stored.get("ts", 0) if stored else self.ttl
+        if not 0 <= age < self.ttl:
+            return None
+        self._remember(key, now - age, stored["result"])
+        return stored["result"]
+
+    def put(self, key: str, result: Dict) -> None:
+        """Zapisz wynik (pamięć + backend)"""
+        self._remember(key, time.monotonic(), result)
+        if self.backend is not None:
+            self.backend.put(key, {"ts": time.time(), "result": result})
+
+    def _remember(self, key: str, ts: float, result: Dict) -> None:
+        with self._lock:
+            self._entries[key] = (ts, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -1,7 +1,8 @@
 """
 Enhancement Worker - Asynchronous worker for prompt enhancement with retry logic
 
-Implements QThread-based worker for enhancing prompts using Ollama API.
+Implements a reusable QObject worker for enhancing prompts using Ollama API,
+run on the shared QThreadPool via EnhancementRunnable.
 Features exponential backoff retry mechanism and comprehensive error handling.
 
 Author: Phase 1 Implementation - R1.2 (Retry System)
@@ -9,21 +10,28 @@ Date: 2026-01-09
 Version: 1.0
 """
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
+import re
+import socket
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
-from threading import Event
+from threading import Event, local
+from urllib.parse import urlsplit
 
 try:
-    from PyQt5.QtCore import QThread, pyqtSignal
+    from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
     PYQT_AVAILABLE = True
 except ImportError:
     PYQT_AVAILABLE = False
     # Fallback for testing without PyQt5
-    class QThread:
+    class QObject:
+        pass
+    class QRunnable:
         pass
     class pyqtSignal:
         def __init__(self, *args):
@@ -34,26 +42,248 @@ except ImportError:
             pass
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Decoder for Ollama stream events (orjson accepts bytes directly, no decode step)
+_load_event = orjson.loads if ORJSON_AVAILABLE else json.loads
 
 # Import Phase 1 infrastructure
 from config.constants import (
     OLLAMA_HOST,
     OLLAMA_API_ENDPOINT,
     DEFAULT_ENHANCEMENT_MODEL,
+    OLLAMA_MODEL_TAG,
     ENHANCEMENT_TIMEOUT,
-    RETRY_ENABLED,
+    OLLAMA_CONNECT_TIMEOUT,
+    OLLAMA_KEEP_ALIVE,
+    OLLAMA_PROBE_TIMEOUT,
+    OLLAMA_PROBE_CACHE_TTL,
+    ENHANCEMENT_BATCH_SIZE,
+    ENHANCEMENT_BUCKET_RATIO,
     RETRY_MAX_ATTEMPTS,
     RETRY_INITIAL_DELAY,
     RETRY_BACKOFF_MULTIPLIER,
     RETRY_MAX_DELAY,
+    RETRY_STATUS_CODES,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_PATH,
+    LLM_CACHE_TTL,
+    LLM_CACHE_MAX_ENTRIES,
+    CACHE_CREATIVITY_STEP,
     get_retry_delay,
 )
-from core import SafeJSONHandler, ParseResult
+from core import SafeJSONHandler, ParseResult, ParseStrategy
+from utils.response_cache import LLMCache, ResponseCache, quantize
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+SYSTEM_PREFIX = """You are a prompt enhancer for image generation AI.
+Rewrite the user's prompt into a richer, more vivid description.
+
+Each request lists its settings before the original prompt:
+- details=<level>: detail level (Niski=low, Średni=medium, Wysoki=high)
+- style=<name>: style focus (Kinematograficzny=cinematic, Artystyczny=artistic, Techniczny=technical)
+- length=<N>: target length of each prompt, around N words
+- creativity=<0.00-1.00>: creativity level (0=conservative, 1=creative)
+
+Rules:
+- Generate BOTH an English version (prompt_en) and Polish version (prompt_pl)
+- Follow the requested target length, detail level, style focus and creativity
+- Be specific: subject, setting, colors, lighting, composition, mood
+
+IMPORTANT: You MUST respond with ONLY valid JSON in this exact format, no other text:
+{
+    "prompt_en": "enhanced English prompt here...",
+    "prompt_pl": "enhanced Polish prompt here...",
+    "word_count": number
+}
+
+Do not include any text before or after the JSON. Only JSON."""
+"""
+Static instructions sent first on every call, byte-for-byte identical, so
+Ollama can reuse the KV cache for this prefix. Never format or interpolate it.
+"""
+
+CHARS_PER_TOKEN = 4
+"""Rough chars/token ratio used to turn the system prompt length into Ollama num_keep"""
+
+_DETAIL_SYSTEM_PROMPTS = {
+    "Niski": "You are a helpful assistant that enhances prompts briefly.",
+    "Średni": "You are an expert at enhancing prompts with visual details and artistic elements.",
+    "Wysoki": "You are a master prompt engineer specializing in creating detailed, vivid descriptions for image generation. Include specific colors, lighting, composition, and emotional tone.",
+}
+
+_STYLE_ADDITIONS = {
+    "Kinematograficzny": "Focus on cinematic framing, lighting setup, camera angles, and composition.",
+    "Artystyczny": "Focus on artistic style, color palette, artistic techniques, and visual aesthetics.",
+    "Techniczny": "Focus on technical details like resolution, bit depth, specific rendering techniques.",
+}
+
+STREAM_FIELDS = ("prompt_en", "prompt_pl")
+"""JSON string fields forwarded to the UI while the response is streaming"""
+
+_JSON_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+
+def _decode_unicode_escape(buf: str, i: int) -> Tuple[str, Optional[int]]:
+    """
+    Decode the \\uXXXX escape starting at buf[i]
+    
+    A high surrogate is joined with the following \\uDCxx escape into one
+    character; unpaired surrogates become U+FFFD, so the text can always
+    be encoded as UTF-8 (orjson rejects lone surrogates).
+    
+    Returns:
+        (text, index after the escape), or ("", None) if the escape
+        (or its surrogate pair) is not fully buffered yet
+    """
+    if i + 6 > len(buf):
+        return "", None
+    try:
+        code = int(buf[i + 2:i + 6], 16)
+    except ValueError:
+        return "", i + 6
+    if 0xDC00 <= code <= 0xDFFF:
+        return "\ufffd", i + 6
+    if not 0xD800 <= code <= 0xDBFF:
+        return chr(code), i + 6
+    low = buf[i + 6:i + 12]
+    if len(low) < 6 and "\\u".startswith(low[:2]):
+        return "", None
+    if low.startswith("\\u"):
+        try:
+            low_code = int(low[2:], 16)
+        except ValueError:
+            low_code = 0
+        if 0xDC00 <= low_code <= 0xDFFF:
+            return chr(0x10000 + ((code - 0xD800) << 10) + (low_code - 0xDC00)), i + 12
+    return "\ufffd", i + 6
+
+
+class StreamFieldExtractor:
+    """
+    Incrementally decodes JSON string field values from a streamed response.
+    
+    The model streams raw JSON text token by token. Each feed() returns only
+    the newly decoded characters of every tracked field, so the UI can append
+    them without ever seeing JSON syntax or re-rendering the whole document.
+    """
+    
+    __slots__ = ("_buffer", "_patterns", "_cursor", "_done", "values")
+    
+    def __init__(self, fields: Tuple[str, ...] = STREAM_FIELDS):
+        self._buffer = ""
+        self._patterns = {f: re.compile(r'"%s"\s*:\s*"' % re.escape(f)) for f in fields}
+        self._cursor: Dict[str, Optional[int]] = dict.fromkeys(fields)
+        self._done = set()
+        self.values: Dict[str, str] = dict.fromkeys(fields, "")
+    
+    @property
+    def complete(self) -> bool:
+        """True once every tracked field's closing quote has been seen"""
+        return len(self._done) == len(self._cursor)
+    
+    def feed(self, chunk: str) -> Dict[str, str]:
+        """Append a chunk and return {field: newly decoded text}"""
+        self._buffer += chunk
+        updates = {}
+        for field, pattern in self._patterns.items():
+            if field in self._done:
+                continue
+            if self._cursor[field] is None:
+                match = pattern.search(self._buffer)
+                if match is None:
+                    continue
+                self._cursor[field] = match.end()
+            text = self._decode(field)
+            if text:
+                updates[field] = text
+                self.values[field] += text
+        return updates
+    
+    def _decode(self, field: str) -> str:
+        """Decode from the field cursor up to the end of buffered data"""
+        buf, i, out = self._buffer, self._cursor[field], []
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self._done.add(field)
+                break
+            if ch != '\\':
+                out.append(ch)
+                i += 1
+                continue
+            if i + 1 >= len(buf):
+                break  # escape split across chunks - wait for more
+            esc = buf[i + 1]
+            if esc == 'u':
+                text, end = _decode_unicode_escape(buf, i)
+                if end is None:
+                    break  # escape or surrogate pair split across chunks
+                out.append(text)
+                i = end
+            else:
+                out.append(_JSON_ESCAPES.get(esc, esc))
+                i += 2
+        self._cursor[field] = i
+        return "".join(out)
+
+
+def _ollama_address(url: str) -> Tuple[str, int]:
+    """(host, port) the HTTP client connects to: explicit port, else the scheme default"""
+    parts = urlsplit(url)
+    default_port = {"http": 80, "https": 443}.get(parts.scheme, 11434)
+    return parts.hostname or "localhost", parts.port or default_port
+
+
+# (host, port) of Ollama for the TCP liveness probe, parsed once
+_OLLAMA_ADDRESS = _ollama_address(OLLAMA_HOST)
+
+# Last probe as (monotonic timestamp, reachable) - shared by all workers
+_probe_cache: Tuple[float, bool] = (float("-inf"), True)
+
+# Stateless, so one non-debug handler serves every worker and thread
+_JSON_HANDLER = SafeJSONHandler(debug=False)
+
+# Shared by all workers: identical requests return without calling Ollama
+_LLM_CACHE = LLMCache(
+    ttl=LLM_CACHE_TTL,
+    max_entries=LLM_CACHE_MAX_ENTRIES,
+    backend=ResponseCache(RESPONSE_CACHE_PATH, ttl=LLM_CACHE_TTL) if RESPONSE_CACHE_ENABLED else None,
+)
+
+# Parse strategies whose output is a real JSON object worth caching
+_CACHEABLE_STRATEGIES = frozenset((ParseStrategy.DIRECT.name, ParseStrategy.REGEX.name))
+
+
+def _resolve_model(model: Optional[str]) -> str:
+    """Default model, plus OLLAMA_MODEL_TAG (quantization) when the name has no tag"""
+    model = model or DEFAULT_ENHANCEMENT_MODEL
+    if OLLAMA_MODEL_TAG and ":" not in model:
+        return f"{model}:{OLLAMA_MODEL_TAG}"
+    return model
+
+
+# Last image analysis seen: (dict, prompt context, digest). One analysis is
+# typically enhanced many times, so its text and hash are built once.
+_image_memo: Tuple[Optional[Dict[str, Any]], str, str] = (None, "", "")
+
+
+class NonRetryableError(Exception):
+    """Ollama rejected the request in a way another attempt cannot fix (e.g. 400, 404)"""
+
+
+class EnhancementCancelled(Exception):
+    """The user cancelled while a response was streaming - the partial text is discarded"""
+
 
 class EnhancementStatus(Enum):
     """Status codes for enhancement operation"""
@@ -67,9 +297,9 @@ class EnhancementStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class EnhancementResult:
-    """Result of enhancement operation"""
+    """Result of enhancement operation (slotted: no per-instance __dict__)"""
     success: bool
     prompt_en: Optional[str] = None
     prompt_pl: Optional[str] = None
@@ -80,9 +310,13 @@ class EnhancementResult:
     raw_response: Optional[str] = None
 
 
-class EnhancementWorker(QThread if PYQT_AVAILABLE else object):
+class EnhancementWorker(QObject if PYQT_AVAILABLE else object):
     """
-    Worker thread for prompt enhancement with retry mechanism.
+    Reusable worker for prompt enhancement with retry mechanism.
+    
+    Holds the signals and enhancement logic; one instance is created per
+    owner and reused across clicks. Run it off the GUI thread with
+    EnhancementRunnable on QThreadPool - no QThread is spawned per request.
     
     Features:
     - Exponential backoff retry (2s, 4s, 8s, 16s, max 30s)
@@ -95,10 +329,15 @@ class EnhancementWorker(QThread if PYQT_AVAILABLE else object):
     """
     
     # PyQt signals (emitted to update UI)
-    status_changed = pyqtSignal(str) if PYQT_AVAILABLE else lambda x: None
-    progress_updated = pyqtSignal(str, int) if PYQT_AVAILABLE else lambda x, y: None
-    result_ready = pyqtSignal(dict) if PYQT_AVAILABLE else lambda x: None
+    # One dict per update: {'status', 'message', 'attempt', 'max', 'percent'}
+    progress = pyqtSignal('PyQt_PyObject') if PYQT_AVAILABLE else lambda x: None
+    # EnhancementResult passed by reference - no QVariant/dict conversion
+    result_ready = pyqtSignal('PyQt_PyObject') if PYQT_AVAILABLE else lambda x: None
     error_occurred = pyqtSignal(str) if PYQT_AVAILABLE else lambda x: None
+    partial_en = pyqtSignal(str) if PYQT_AVAILABLE else lambda x: None
+    partial_pl = pyqtSignal(str) if PYQT_AVAILABLE else lambda x: None
+    partial_reset = pyqtSignal() if PYQT_AVAILABLE else lambda: None
+    finished = pyqtSignal(bool, dict) if PYQT_AVAILABLE else lambda x, y: None
     
     def __init__(self, debug: bool = False):
         """
@@ -112,17 +351,27 @@ class EnhancementWorker(QThread if PYQT_AVAILABLE else object):
         
         self.debug = debug
         self.cancelled = Event()
-        self.json_handler = SafeJSONHandler(debug=debug)
+        # Last emitted status/message per thread: enhance_batch runs several
+        # enhance_direct calls on one worker at once, each on its own thread
+        self._progress_state = local()
+        # Off during enhance_batch - concurrent streams would interleave in the UI
+        self._stream_partials = True
+        self.json_handler = SafeJSONHandler(debug=True) if debug else _JSON_HANDLER
+        # Responses being streamed right now - cancel() closes them
+        self._responses = set()
+        
+        # Keep-alive connection pool reused by every attempt of every request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        })
         
         logger.info("EnhancementWorker initialized")
     
-    def run(self):
-        """
-        Main worker loop (called by QThread.start())
-        Override this to add custom enhancement logic
-        """
-        logger.info("EnhancementWorker started")
-    
     def enhance_direct(
         self,
         prompt: str,
@@ -130,7 +379,9 @@ class EnhancementWorker(QThread if PYQT_AVAILABLE else object):
         creativity: float = 0.7,
         length: int = 350,
         details: str = "Wysoki",
-        style: str = "Kinematograficzny"
+        style: str = "Kinematograficzny",
+        image_analysis: Optional[Dict[str, Any]] = None,
+        regenerate: bool = False
     ) -> EnhancementResult:
         """
         Enhance prompt directly with retry logic (R1.2)
@@ -142,24 +393,55 @@ class EnhancementWorker(QThread if PYQT_AVAILABLE else object):
             length: Target length in words
             details: Detail level (Niski/Średni/Wysoki)
             style: Style (Kinematograficzny/Artystyczny/Techniczny)
+            image_analysis: Optional reference image attributes
+            regenerate: Skip the cache lookup to get a new variation
+                (the new result replaces the cached one)
         
         Returns:
             EnhancementResult with enhanced prompts or error
         """
-        start_time = time.time()
-        model = model or DEFAULT_ENHANCEMENT_MODEL
+        start_time = time.monotonic()
+        model = _resolve_model(model)
+        self._progress_state.status = None
+        self._progress_state.message = None
         
-        logger.info(f"Starting enhancement: prompt_len={len(prompt)}, model={model}")
-        self._emit_status("PREPARING")
+        logger.info("Starting enhancement: prompt_len=%d, model=%s", len(prompt), model)
+        self._emit_update(status="PREPARING")
         
         # Build enhancement prompt
         system_prompt = self._build_system_prompt(details, style)
         enhancement_prompt = self._build_enhancement_prompt(
             prompt, creativity, length, details, style
         )
+        if image_analysis:
+            enhancement_prompt += self._image_parts(image_analysis)[0]
         
-        logger.debug(f"System prompt length: {len(system_prompt)}")
-        logger.debug(f"Enhancement prompt length: {len(enhancement_prompt)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("System prompt length: %d", len(system_prompt))
+            logger.debug("Enhancement prompt length: %d", len(enhancement_prompt))
+        
+        # Cache lookup - same model, prompt and settings
+        cache_key = self._cache_key(prompt, model, creativity, length, details, style, image_analysis)
+        cached = None if regenerate else _LLM_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("✅ Enhancement served from cache")
+            self._emit_update(status="CACHE_HIT")
+            return EnhancementResult(
+                success=True,
+                prompt_en=cached.get('prompt_en'),
+                prompt_pl=cached.get('prompt_pl'),
+                strategy_used=cached.get('strategy_used'),
+                attempts=0,
+                total_time=time.monotonic() - start_time
+            )
+        
+        # Serialize the request once - retries resend the same bytes
+        body = self._build_payload(
+            model=model,
+            prompt=enhancement_prompt,
+            system=system_prompt,
+            temperature=creativity
+        )
         
         # Retry loop with exponential backoff (R1.2)
         last_error = None
@@ -171,41 +453,36 @@ class EnhancementWorker(QThread if PYQT_AVAILABLE else object):
                     success=False,
                     error_message="Cancelled by user",
                     attempts=attempt + 1,
-                    total_time=time.time() - start_time
+                    total_time=time.monotonic() - start_time
                 )
             
             try:
-                logger.info(f"Attempt {attempt + 1}/{RETRY_MAX_ATTEMPTS}")
-                self._emit_progress(f"Attempt {attempt + 1}", attempt)
-                self._emit_status("SENDING")
+                logger.info("Attempt %d/%d", attempt + 1, RETRY_MAX_ATTEMPTS)
+                self._emit_update("SENDING", f"Attempt {attempt + 1}", attempt)
                 
-                # Call Ollama API
-                response = self._call_ollama_api(
-                    model=model,
-                    prompt=enhancement_prompt,
-                    system=system_prompt
-                )
+                # Call Ollama API (same pre-serialized body on every attempt)
+                response = self._call_ollama_api(body)
                 
-                logger.debug(f"Response received: {len(response)} chars")
-                self._emit_status("PARSING")
+                # Parsing takes milliseconds - no separate PARSING update
+                logger.debug("Response received: %d chars", len(response))
                 
                 # Parse with SafeJSONHandler (R1.1)
                 parse_result = self.json_handler.parse(response)
                 
                 if parse_result.success:
                     logger.info("✅ Enhancement SUCCESS")
-                    self._emit_status("SUCCESS")
+                    self._emit_update(status="SUCCESS")
                     
-                    return EnhancementResult(
+                    return self._cache_result(cache_key, EnhancementResult(
                         success=True,
                         prompt_en=parse_result.data.get('prompt_en'),
                         prompt_pl=parse_result.data.get('prompt_pl'),
                         strategy_used=parse_result.strategy_used.name,
                         attempts=attempt + 1,
-                        total_time=time.time() - start_time
-                    )
+                        total_time=time.monotonic() - start_time
+                    ))
                 else:
-                    logger.warning(f"Parse failed: {parse_result.error_message}")
+                    logger.warning("Parse failed: %s", parse_result.error_message)
                     last_error = f"Parse error: {parse_result.error_message}"
                     
                     # If we have fallback data and required keys, use it
@@ -219,71 +496,301 @@ class EnhancementWorker(QThread if PYQT_AVAILABLE else object):
                             prompt_pl=parse_result.data.get('prompt_pl'),
                             strategy_used=parse_result.strategy_used.name,
                             attempts=attempt + 1,
-                            total_time=time.time() - start_time
+                            total_time=time.monotonic() - start_time
                         )
             
+            except EnhancementCancelled:
+                logger.warning("Enhancement cancelled while streaming")
+                self._emit_update(status="CANCELLED")
+                return EnhancementResult(
+                    success=False,
+                    error_message="Cancelled by user",
+                    attempts=attempt + 1,
+                    total_time=time.monotonic() - start_time
+                )
+            
+            except NonRetryableError as e:
+                logger.error("Non-retryable error on attempt %d: %s", attempt + 1, e)
+                self._emit_update(status="FAILED")
+                self._emit_error(str(e))
+                return EnhancementResult(
+                    success=False,
+                    error_message=str(e),
+                    attempts=attempt + 1,
+                    total_time=time.monotonic() - start_time
+                )
+            
             except requests.Timeout:
                 last_error = "Ollama timeout (exceeded 120s)"
-                logger.warning(f"Timeout on attempt {attempt + 1}")
+                logger.warning("Timeout on attempt %d", attempt + 1)
                 
             except requests.ConnectionError:
-                last_error = "Cannot connect to Ollama (localhost:11434)"
-                logger.warning(f"Connection error on attempt {attempt + 1}")
+                last_error = "Cannot connect to Ollama (%s:%d)" % _OLLAMA_ADDRESS
+                logger.warning("Connection error on attempt %d", attempt + 1)
+                
+                # Circuit breaker: Ollama not listening at all - retrying is pointless
+                if not self._probe_ollama():
+                    logger.error("Ollama offline - skipping remaining attempts")
+                    self._emit_update(status="FAILED")
+                    self._emit_error("Ollama offline")
+                    return EnhancementResult(
+                        success=False,
+                        error_message="Ollama offline",
+                        attempts=attempt + 1,
+                        total_time=time.monotonic() - start_time
+                    )
                 
             except json.JSONDecodeError as e:
                 last_error = f"Invalid JSON from Ollama: {str(e)[:100]}"
-                logger.warning(f"JSON error on attempt {attempt + 1}: {last_error}")
+                logger.warning("JSON error on attempt %d: %s", attempt + 1, last_error)
                 
             except Exception as e:
                 last_error = str(e)[:200]
-                logger.error(f"Unexpected error on attempt {attempt + 1}: {last_error}")
+                logger.error("Unexpected error on attempt %d: %s", attempt + 1, last_error)
             
             # Retry logic with exponential backoff (R1.2)
             if attempt < RETRY_MAX_ATTEMPTS - 1:
                 delay = get_retry_delay(attempt)
-                logger.warning(f"Retrying in {delay}s... (attempt {attempt + 1}/{RETRY_MAX_ATTEMPTS})")
-                self._emit_progress(f"Retrying in {delay:.0f}s", attempt + 1)
-                self._emit_status(f"RETRYING_{attempt + 1}")
+                logger.warning("Retrying in %ss... (attempt %d/%d)", delay, attempt + 1, RETRY_MAX_ATTEMPTS)
+                self._emit_update(f"RETRYING_{attempt + 1}", f"Retrying in {delay:.0f}s", attempt + 1)
                 
-                # Sleep with cancellation check
-                for _ in range(int(delay * 10)):
-                    if self.cancelled.is_set():
-                        logger.warning("Enhancement cancelled during retry delay")
-                        return EnhancementResult(
-                            success=False,
-                            error_message="Cancelled by user",
-                            attempts=attempt + 1,
-                            total_time=time.time() - start_time
-                        )
-                    time.sleep(0.1)
+                if self._sleep_cancellable(delay):
+                    logger.warning("Enhancement cancelled during retry delay")
+                    return EnhancementResult(
+                        success=False,
+                        error_message="Cancelled by user",
+                        attempts=attempt + 1,
+                        total_time=time.monotonic() - start_time
+                    )
             else:
                 logger.error("All retry attempts exhausted")
         
         # All attempts failed
-        logger.error(f"❌ Enhancement FAILED after {RETRY_MAX_ATTEMPTS} attempts")
-        self._emit_status("FAILED")
+        logger.error("❌ Enhancement FAILED after %d attempts", RETRY_MAX_ATTEMPTS)
+        self._emit_update(status="FAILED")
         self._emit_error(last_error)
         
         return EnhancementResult(
             success=False,
             error_message=last_error or "Unknown error",
             attempts=RETRY_MAX_ATTEMPTS,
-            total_time=time.time() - start_time
+            total_time=time.monotonic() - start_time
         )
     
-    def _call_ollama_api(
-        self,
-        model: str,
+    def enhance_batch(self, prompts: List[Dict[str, Any]]) -> List[Optional[EnhancementResult]]:
+        """
+        Enhance several prompts in one burst
+        
+        Prompts are grouped by model; each group's model is loaded once
+        (warm_up) and split into length buckets (_length_buckets) of up to
+        ENHANCEMENT_BATCH_SIZE requests sent together, so Ollama decodes
+        them in shared forward passes and no slot idles waiting for a much
+        longer neighbour.
+        
+        Args:
+            prompts: Keyword arguments for enhance_direct, one dict per prompt
+        
+        Returns:
+            One result per prompt, in input order; None for prompts
+            never started because the batch was cancelled
+        """
+        if not prompts:
+            return []
+        
+        # Identical requests run once; duplicates share the result
+        first: Dict[str, int] = {}
+        duplicates: List[Tuple[int, int]] = []
+        groups: Dict[str, List[int]] = {}
+        for index, params in enumerate(prompts):
+            key = self._cache_key(**params)
+            if key in first:
+                duplicates.append((index, first[key]))
+                continue
+            first[key] = index
+            groups.setdefault(_resolve_model(params.get('model')), []).append(index)
+        
+        results: List[Optional[EnhancementResult]] = [None] * len(prompts)
+        done = 0
+        self._stream_partials = False
+        try:
+            for model, indices in groups.items():
+                if self.cancelled.is_set():
+                    break
+                self.warm_up(model)
+                for bucket in self._length_buckets(prompts, indices):
+                    if self.cancelled.is_set():
+                        break
+                    with ThreadPoolExecutor(max_workers=len(bucket)) as pool:
+                        futures = [(i, pool.submit(self.enhance_direct, **prompts[i])) for i in bucket]
+                        for index, future in futures:
+                            results[index] = future.result()
+                            done += 1
+                            self._emit_update(message=f"Batch {done}/{len(prompts)}")
+        finally:
+            self._stream_partials = True
+        
+        for index, source in duplicates:
+            results[index] = results[source]
+        
+        if self.cancelled.is_set():
+            logger.warning("Batch cancelled after %d/%d prompts", done, len(prompts))
+        
+        return results
+    
+    @staticmethod
+    def _cache_key(
         prompt: str,
-        system: str = ""
+        model: Optional[str] = None,
+        creativity: float = 0.7,
+        length: int = 350,
+        details: str = "Wysoki",
+        style: str = "Kinematograficzny",
+        image_analysis: Optional[Dict[str, Any]] = None
     ) -> str:
         """
-        Call Ollama API with proper error handling
+        Cache key for one request (same arguments as enhance_direct)
+        
+        Creativity is quantized to CACHE_CREATIVITY_STEP so nudging the
+        slider back and forth hits the same entry.
+        """
+        return ResponseCache.make_key(
+            model=_resolve_model(model),
+            prompt=prompt,
+            c=quantize(creativity, CACHE_CREATIVITY_STEP),
+            l=length,
+            d=details,
+            s=style,
+            img=EnhancementWorker._image_parts(image_analysis)[1] if image_analysis else None,
+        )
+    
+    @staticmethod
+    def _length_buckets(prompts: List[Dict[str, Any]], indices: List[int]) -> List[List[int]]:
+        """
+        Split prompt indices into buckets of similar estimated length
+        
+        Estimate = prompt tokens (~CHARS_PER_TOKEN chars each) + target
+        length. Sorted by estimate; a new bucket starts when a request
+        exceeds ENHANCEMENT_BUCKET_RATIO x the bucket's shortest one or
+        the bucket holds ENHANCEMENT_BATCH_SIZE requests.
+        """
+        def estimate(index: int) -> int:
+            params = prompts[index]
+            return len(params['prompt']) // CHARS_PER_TOKEN + params.get('length', 350)
+        
+        buckets: List[List[int]] = []
+        bucket_min = 0
+        for index in sorted(indices, key=estimate):
+            size = estimate(index)
+            if (not buckets or len(buckets[-1]) >= ENHANCEMENT_BATCH_SIZE
+                    or size > ENHANCEMENT_BUCKET_RATIO * bucket_min):
+                buckets.append([])
+                bucket_min = size
+            buckets[-1].append(index)
+        return buckets
+    
+    def warm_up(self, model: Optional[str] = None) -> bool:
+        """
+        Load the model into Ollama memory without generating anything
+        
+        Returns:
+            True if Ollama accepted the request
+        """
+        model = _resolve_model(model)
+        try:
+            response = self.session.post(
+                OLLAMA_API_ENDPOINT,
+                json={"model": model, "keep_alive": OLLAMA_KEEP_ALIVE, "stream": False},
+                timeout=(OLLAMA_CONNECT_TIMEOUT, ENHANCEMENT_TIMEOUT)
+            )
+            response.raise_for_status()
+            logger.info("Model warmed up: %s", model)
+            return True
+        except requests.RequestException as e:
+            logger.warning("Model warm-up failed: %s", e)
+            return False
+    
+    @staticmethod
+    def _probe_ollama() -> bool:
+        """
+        Fast TCP check whether anything listens on the Ollama port
+        
+        The result is cached for OLLAMA_PROBE_CACHE_TTL seconds so
+        back-to-back attempts do not probe again.
+        """
+        global _probe_cache
+        checked_at, reachable = _probe_cache
+        now = time.monotonic()
+        if now - checked_at < OLLAMA_PROBE_CACHE_TTL:
+            return reachable
+        
+        try:
+            socket.create_connection(_OLLAMA_ADDRESS, timeout=OLLAMA_PROBE_TIMEOUT).close()
+            reachable = True
+        except OSError:
+            reachable = False
+        _probe_cache = (now, reachable)
+        logger.debug("Ollama probe %s:%d -> %s", *_OLLAMA_ADDRESS, reachable)
+        return reachable
+    
+    def _cache_result(self, key: str, result: EnhancementResult) -> EnhancementResult:
+        """
+        Store a result in the LLM cache and pass it through
+        
+        Only real JSON parses (DIRECT/REGEX) with both prompts are stored -
+        SPLIT/PARTIAL also report success for refusals or garbage, which
+        must not be replayed from the cache.
+        """
+        if (result.strategy_used not in _CACHEABLE_STRATEGIES
+                or not result.prompt_en or not result.prompt_pl):
+            return result
+        _LLM_CACHE.put(key, {
+            'prompt_en': result.prompt_en,
+            'prompt_pl': result.prompt_pl,
+            'strategy_used': result.strategy_used,
+        })
+        return result
+    
+    @staticmethod
+    def _build_payload(
+        model: str,
+        prompt: str,
+        system: str = "",
+        temperature: float = 0.7
+    ) -> bytes:
+        """
+        Serialize the Ollama generate request body
         
         Args:
             model: Model name
             prompt: Prompt text
             system: System prompt
+            temperature: Sampling temperature (the user's creativity)
+        
+        Returns:
+            UTF-8 JSON body (orjson when available)
+        """
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "system": system,
+            "stream": True,  # NDJSON chunks, forwarded to the UI as they arrive
+            "keep_alive": OLLAMA_KEEP_ALIVE,
+            "options": {
+                "temperature": temperature,
+                # Whole per-(details, style) system prompt stays in the KV cache
+                "num_keep": len(system) // CHARS_PER_TOKEN,
+            },
+        }
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(payload)
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    
+    def _call_ollama_api(self, body: bytes) -> str:
+        """
+        Call Ollama API with proper error handling
+        
+        Args:
+            body: Serialized request from _build_payload
         
         Returns:
             Response text from Ollama
@@ -291,264 +798,284 @@ class EnhancementWorker(QThread if PYQT_AVAILABLE else object):
         Raises:
             requests.Timeout: If request times out
             requests.ConnectionError: If cannot connect to Ollama
+            NonRetryableError: HTTP error status outside RETRY_STATUS_CODES
+            EnhancementCancelled: Cancelled while the response was streaming
             Exception: Other errors
         """
-        url = f"{OLLAMA_API_ENDPOINT}/generate"
-        
-        payload = {
-            "model": model,
-            "prompt": prompt,
-            "system": system,
-            "stream": False,  # Non-streaming for simplicity
-            "temperature": 0.7,
-        }
+        url = OLLAMA_API_ENDPOINT
         
-        logger.debug(f"Calling Ollama: {url}")
-        logger.debug(f"Model: {model}, Prompt len: {len(prompt)}")
+        logger.debug("Calling Ollama: %s (%d byte body)", url, len(body))
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
-                json=payload,
-                timeout=ENHANCEMENT_TIMEOUT,
-                headers={"Content-Type": "application/json"}
+                data=body,
+                timeout=(OLLAMA_CONNECT_TIMEOUT, ENHANCEMENT_TIMEOUT),
+                stream=True
             )
             
             response.raise_for_status()
-            response_data = response.json()
+            logger.debug("Ollama response status: %d", response.status_code)
             
-            logger.debug(f"Ollama response status: {response.status_code}")
-            
-            return response_data.get('response', '')
+            return self._read_stream(response)
         
         except requests.Timeout:
-            logger.error(f"Ollama timeout after {ENHANCEMENT_TIMEOUT}s")
+            logger.error("Ollama timeout after %ss", ENHANCEMENT_TIMEOUT)
             raise
         except requests.ConnectionError as e:
-            logger.error(f"Cannot connect to Ollama at {OLLAMA_HOST}: {e}")
+            logger.error("Cannot connect to Ollama at %s: %s", OLLAMA_HOST, e)
+            raise
+        except requests.HTTPError as e:
+            status = e.response.status_code
+            logger.error("Ollama returned HTTP %d", status)
+            if status not in RETRY_STATUS_CODES:
+                raise NonRetryableError(
+                    f"Ollama returned HTTP {status}: {self._error_snippet(e.response)}"
+                ) from e
+            e.response.close()
+            raise
+        except EnhancementCancelled:
             raise
         except Exception as e:
-            logger.error(f"Error calling Ollama API: {e}")
+            logger.error("Error calling Ollama API: %s", e)
             raise
     
-    def _build_system_prompt(self, details: str, style: str) -> str:
-        """Build system prompt based on detail level and style"""
+    @staticmethod
+    def _error_snippet(response, limit: int = 256) -> str:
+        """
+        Decode only the start of an error body, then release the connection
         
-        system_prompts = {
-            "Niski": "You are a helpful assistant that enhances prompts briefly.",
-            "Średni": "You are an expert at enhancing prompts with visual details and artistic elements.",
-            "Wysoki": "You are a master prompt engineer specializing in creating detailed, vivid descriptions for image generation. Include specific colors, lighting, composition, and emotional tone.",
-        }
+        The response is streamed, so .text would download and decode the
+        whole error page just to slice it.
+        """
+        try:
+            head = next(response.iter_content(limit), b"")[:limit]
+        except requests.RequestException:
+            head = b""
+        finally:
+            response.close()
+        return head.decode('utf-8', 'replace')
+    
+    def _read_stream(self, response) -> str:
+        """
+        Consume Ollama NDJSON stream, emitting partial prompt text
         
-        style_additions = {
-            "Kinematograficzny": "Focus on cinematic framing, lighting setup, camera angles, and composition.",
-            "Artystyczny": "Focus on artistic style, color palette, artistic techniques, and visual aesthetics.",
-            "Techniczny": "Focus on technical details like resolution, bit depth, specific rendering techniques.",
-        }
+        Stops reading as soon as prompt_en and prompt_pl are both closed;
+        closing the response makes Ollama abort the rest of the generation
+        (trailing fields such as word_count are never needed).
+        
+        Returns:
+            Response text (parsed afterwards as usual)
+        
+        Raises:
+            EnhancementCancelled: cancel() was called before the stream ended
+        """
+        extractor = StreamFieldExtractor()
+        parts = []
+        emit_partials = PYQT_AVAILABLE and self._stream_partials
+        if emit_partials:
+            self.partial_reset.emit()
+        
+        self._responses.add(response)
+        try:
+            for line in response.iter_lines():
+                if self.cancelled.is_set():
+                    break
+                if not line:
+                    continue
+                chunk = _load_event(line)
+                token = chunk.get('response', '')
+                if token:
+                    parts.append(token)
+                    updates = extractor.feed(token)
+                    if emit_partials and updates:
+                        if 'prompt_en' in updates:
+                            self.partial_en.emit(updates['prompt_en'])
+                        if 'prompt_pl' in updates:
+                            self.partial_pl.emit(updates['prompt_pl'])
+                if extractor.complete:
+                    logger.debug("Both prompts complete - stopping generation early")
+                    return json.dumps(extractor.values, ensure_ascii=False)
+                if chunk.get('done'):
+                    break
+        except Exception:
+            # cancel() closing the response mid-read surfaces as a read error
+            if not self.cancelled.is_set():
+                raise
+        finally:
+            self._responses.discard(response)
+            response.close()
         
-        base = system_prompts.get(details, system_prompts["Wysoki"])
-        addition = style_additions.get(style, style_additions["Kinematograficzny"])
+        if self.cancelled.is_set():
+            raise EnhancementCancelled("Cancelled by user")
+        return "".join(parts)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _build_system_prompt(details: str, style: str) -> str:
+        """
+        Build system prompt: static SYSTEM_PREFIX + detail/style guidance
         
-        return f"{base} {addition}"
+        The guidance only depends on the combo settings, so consecutive
+        calls with the same settings share the whole system prompt and
+        Ollama reuses its KV cache; only the short tail from
+        _build_enhancement_prompt is prefilled. num_keep in the payload
+        covers the whole system prompt, so it survives context shifts.
+        Pure function of its arguments - memoized.
+        """
+        base = _DETAIL_SYSTEM_PROMPTS.get(details, _DETAIL_SYSTEM_PROMPTS["Wysoki"])
+        addition = _STYLE_ADDITIONS.get(style, _STYLE_ADDITIONS["Kinematograficzny"])
+        
+        return f"{SYSTEM_PREFIX}\n\n{base} {addition}"
     
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _build_enhancement_prompt(
-        self,
         prompt: str,
         creativity: float,
         length: int,
         details: str,
         style: str
     ) -> str:
-        """Build enhancement prompt with user specifications"""
+        """
+        Build the short variable tail of the request
         
-        return f"""Enhance this prompt for an image generation AI:
-
-Original prompt: "{prompt}"
-
-Requirements:
-- Generate BOTH an English version (prompt_en) and Polish version (prompt_pl)
-- Target length: around {length} words
-- Detail level: {details}
-- Style focus: {style}
-- Creativity level: {creativity:.1f} (0=conservative, 1=creative)
-
-IMPORTANT: You MUST respond with ONLY valid JSON in this exact format, no other text:
-{{
-    "prompt_en": "enhanced English prompt here...",
-    "prompt_pl": "enhanced Polish prompt here...",
-    "word_count": number
-}}
-
-Do not include any text before or after the JSON. Only JSON."""
+        Static-prefix rule: everything invariant (SYSTEM_PREFIX, JSON format)
+        goes out first as the system prompt; here settings come in a fixed
+        order and format and the user prompt last, so only the end of the
+        context changes between calls. Memoized for repeated requests.
+        """
+        return (
+            f"details={details}\n"
+            f"style={style}\n"
+            f"length={length}\n"
+            f"creativity={creativity:.2f}\n"
+            f"Respond with the JSON object (prompt_en, prompt_pl) only.\n"
+            f'Original prompt: "{prompt}"'
+        )
     
-    def _emit_status(self, status: str):
-        """Emit status changed signal"""
-        if PYQT_AVAILABLE:
-            self.status_changed.emit(status)
-        logger.debug(f"Status: {status}")
+    @staticmethod
+    def _image_parts(image_analysis: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Prompt context and cache digest of an image analysis
+        
+        Memoized on the identity of the dict (the UI keeps one dict per
+        analysed image and never mutates it), so repeated enhancements of
+        the same image skip formatting and serialization.
+        """
+        global _image_memo
+        memo = _image_memo
+        if memo[0] is not image_analysis:
+            memo = (
+                image_analysis,
+                EnhancementWorker._build_image_context(image_analysis),
+                ResponseCache.make_key(img=image_analysis),
+            )
+            _image_memo = memo
+        return memo[1], memo[2]
     
-    def _emit_progress(self, message: str, value: int):
-        """Emit progress updated signal"""
-        if PYQT_AVAILABLE:
-            self.progress_updated.emit(message, value)
-        logger.debug(f"Progress: {message} ({value}%)")
+    @staticmethod
+    def _build_image_context(image_analysis: Dict[str, Any]) -> str:
+        """Append reference image attributes to the enhancement prompt"""
+        lines = "\n".join(
+            f"- {key}: {value}" for key, value in image_analysis.items()
+            if value not in (None, "", [], {})
+        )
+        return f"\n\nReference image attributes (keep the prompt consistent with them):\n{lines}"
+    
+    def _emit_update(
+        self,
+        status: Optional[str] = None,
+        message: Optional[str] = None,
+        attempt: Optional[int] = None
+    ):
+        """
+        Emit one combined progress signal
+        
+        A single cross-thread dispatch per update instead of one per
+        field; status and message are included only when they changed
+        for the calling thread, and nothing is emitted when no field changed.
+        """
+        state = self._progress_state
+        update = {}
+        if status is not None and status != getattr(state, 'status', None):
+            state.status = status
+            update['status'] = status
+        if message is not None and message != getattr(state, 'message', None):
+            state.message = message
+            update['message'] = message
+        if attempt is not None:
+            update['attempt'] = attempt + 1
+            update['max'] = RETRY_MAX_ATTEMPTS
+            update['percent'] = min(100, attempt * 100 // RETRY_MAX_ATTEMPTS)
+        if PYQT_AVAILABLE and update:
+            self.progress.emit(update)
+        logger.debug("Progress: %s", update)
     
     def _emit_error(self, error: str):
         """Emit error occurred signal"""
         if PYQT_AVAILABLE:
             self.error_occurred.emit(error)
-        logger.error(f"Error: {error}")
+        logger.error("Error: %s", error)
+    
+    def _sleep_cancellable(self, delay: float) -> bool:
+        """Sleep up to delay seconds; wakes immediately on cancel. Returns True if cancelled"""
+        return self.cancelled.wait(timeout=delay)
     
     def cancel(self):
         """Cancel current enhancement operation"""
         logger.warning("Enhancement cancellation requested")
         self.cancelled.set()
+        # Closing the streamed response unblocks a read waiting for the next
+        # token; session.close() alone only drops idle pooled sockets
+        for response in list(self._responses):
+            response.close()
+        self.close()
+    
+    def close(self):
+        """Close pooled HTTP connections (the session reconnects on next use)"""
+        self.session.close()
 
 
-# ============================================================================
-# UNIT TESTS
-# ============================================================================
-
-class TestEnhancementWorker:
-    """Unit tests for EnhancementWorker"""
-    
-    @staticmethod
-    def test_worker_initialization():
-        """Test 1: Worker initializes correctly"""
-        worker = EnhancementWorker(debug=True)
-        
-        assert worker is not None
-        assert worker.json_handler is not None
-        assert RETRY_ENABLED is True
-        assert RETRY_MAX_ATTEMPTS == 3
-        
-        print("✅ Test 1 PASSED: Worker initialization")
-        return True
-    
-    @staticmethod
-    def test_system_prompt_building():
-        """Test 2: System prompts are built correctly"""
-        worker = EnhancementWorker(debug=True)
-        
-        # Test Wysoki detail
-        prompt = worker._build_system_prompt("Wysoki", "Kinematograficzny")
-        assert "master prompt engineer" in prompt
-        assert "cinematic" in prompt
-        
-        # Test Niski detail
-        prompt = worker._build_system_prompt("Niski", "Artystyczny")
-        assert "briefly" in prompt
-        assert "artistic" in prompt
-        
-        print("✅ Test 2 PASSED: System prompt building")
-        return True
-    
-    @staticmethod
-    def test_enhancement_prompt_building():
-        """Test 3: Enhancement prompts are properly formatted"""
-        worker = EnhancementWorker(debug=True)
-        
-        prompt = worker._build_enhancement_prompt(
-            prompt="beautiful woman",
-            creativity=0.7,
-            length=350,
-            details="Wysoki",
-            style="Kinematograficzny"
-        )
-        
-        assert "prompt_en" in prompt
-        assert "prompt_pl" in prompt
-        assert "350" in prompt
-        assert "JSON" in prompt
-        assert "beautiful woman" in prompt
-        
-        print("✅ Test 3 PASSED: Enhancement prompt building")
-        return True
+class EnhancementRunnable(QRunnable):
+    """
+    One enhancement request executed on QThreadPool.
     
-    @staticmethod
-    def test_retry_delay_calculation():
-        """Test 4: Retry delays are calculated correctly"""
-        
-        # Test exponential backoff
-        assert get_retry_delay(0) == 2.0
-        assert get_retry_delay(1) == 4.0
-        assert get_retry_delay(2) == 8.0
-        assert get_retry_delay(3) == 16.0
-        
-        # Test capping at max delay
-        assert get_retry_delay(10) == 30.0  # Capped
-        
-        print("✅ Test 4 PASSED: Retry delay calculation")
-        return True
+    Reuses the owner's EnhancementWorker (signals are connected once) and
+    reports the outcome twice: worker.result_ready(EnhancementResult) with
+    the full result object, and worker.finished(success, result_dict),
+    where result_dict holds prompt_en/prompt_pl or error.
+    """
     
-    @staticmethod
-    def test_enhancement_result_dataclass():
-        """Test 5: EnhancementResult dataclass works"""
-        
-        result = EnhancementResult(
-            success=True,
-            prompt_en="test",
-            prompt_pl="test",
-            attempts=1,
-            total_time=1.5
-        )
-        
-        assert result.success is True
-        assert result.prompt_en == "test"
-        assert result.attempts == 1
-        assert result.total_time == 1.5
-        
-        # Test failed result
-        failed = EnhancementResult(
-            success=False,
-            error_message="Test error"
-        )
-        
-        assert failed.success is False
-        assert failed.error_message == "Test error"
-        
-        print("✅ Test 5 PASSED: EnhancementResult dataclass")
-        return True
+    def __init__(self, worker: EnhancementWorker, params: Dict[str, Any]):
+        """
+        Args:
+            worker: Shared worker holding logic and signals
+            params: Keyword arguments for EnhancementWorker.enhance_direct
+        """
+        super().__init__()
+        self.worker = worker
+        self.params = params
     
-    @staticmethod
-    def run_all_tests():
-        """Run all unit tests"""
-        print("\n" + "="*70)
-        print("RUNNING UNIT TESTS FOR EnhancementWorker")
-        print("="*70)
-        
+    def run(self):
+        """Executed on a pool thread"""
+        self.worker.cancelled.clear()
         try:
-            TestEnhancementWorker.test_worker_initialization()
-            TestEnhancementWorker.test_system_prompt_building()
-            TestEnhancementWorker.test_enhancement_prompt_building()
-            TestEnhancementWorker.test_retry_delay_calculation()
-            TestEnhancementWorker.test_enhancement_result_dataclass()
-            
-            print("\n" + "="*70)
-            print("✅ ALL TESTS PASSED")
-            print("="*70 + "\n")
-            return True
-        except AssertionError as e:
-            print(f"\n❌ TEST FAILED: {str(e)}\n")
-            return False
+            result = self.worker.enhance_direct(**self.params)
         except Exception as e:
-            print(f"\n❌ UNEXPECTED ERROR: {str(e)}\n")
-            return False
-
-
-# ============================================================================
-# MAIN - Run tests if executed directly
-# ============================================================================
-
-if __name__ == "__main__":
-    # Configure logging for testing
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='[%(asctime)s] [%(levelname)s] %(name)s - %(message)s'
-    )
-    
-    # Run tests
-    success = TestEnhancementWorker.run_all_tests()
-    
-    # Exit with appropriate code
-    exit(0 if success else 1)
+            logger.error("Enhancement runnable failed: %s", e, exc_info=True)
+            result = EnhancementResult(success=False, error_message=str(e)[:200])
+        
+        if result.success:
+            payload = {
+                "prompt_en": result.prompt_en or "",
+                "prompt_pl": result.prompt_pl or "",
+                "strategy_used": result.strategy_used,
+                "attempts": result.attempts,
+            }
+        else:
+            payload = {"error": result.error_message or "Unknown error"}
+        
+        if PYQT_AVAILABLE:
+            self.worker.result_ready.emit(result)
+            self.worker.finished.emit(result.success, payload)
@@ -9,14 +9,25 @@ INSTRUKCJA:
 """
 
 import logging
-from PyQt5.QtCore import QThread, pyqtSignal
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Event
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from core.image_processor import ImageAnalyzer, DeepAttributeAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Analiza atrybutów liczy się równolegle z techniczną (PIL/NumPy zwalniają GIL)
+_DEEP_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="deep-analysis")
 
-class ImageAnalysisWorker(QThread):
-    """Worker do analizy obrazu w osobnym wątku"""
+
+class ImageAnalysisWorker(QObject):
+    """
+    Worker do analizy obrazu
+    
+    Zamiast nowego QThread na każdy obraz, start() wrzuca analizę
+    do wspólnej puli wątków (QThreadPool), tak jak EnhancementRunnable.
+    """
     
     started = pyqtSignal()
     progress = pyqtSignal(str)
@@ -26,31 +37,59 @@ class ImageAnalysisWorker(QThread):
     def __init__(self, image_path: str):
         super().__init__()
         self.image_path = image_path
+        self.cancelled = Event()
+    
+    def cancel(self):
+        """Porzuć analizę - wynik nie będzie już emitowany"""
+        self.cancelled.set()
+    
+    def start(self):
+        """Uruchom analizę w globalnej puli wątków"""
+        QThreadPool.globalInstance().start(ImageAnalysisRunnable(self))
     
     def run(self):
         """Główna logika wątku"""
         
         try:
-            logger.info(f"Image analysis worker started: {self.image_path}")
+            logger.info("Image analysis worker started: %s", self.image_path)
             self.started.emit()
             
-            self.progress.emit("📊 Analiza techniczna obrazu...")
-            tech_data = ImageAnalyzer.analyze_image(self.image_path)
+            # Plik czytany raz; obie analizy dekodują ten sam bufor
+            try:
+                data = Path(self.image_path).read_bytes()
+            except OSError as e:
+                logger.error("Błąd odczytu obrazu: %s", e)
+                self.error.emit(str(e))
+                self.finished.emit(False, {"error": str(e)})
+                return
+            
+            if self.cancelled.is_set():
+                logger.info("Image analysis cancelled: %s", self.image_path)
+                return
+            
+            self.progress.emit("📊 Analiza techniczna i rozpoznawanie atrybutów...")
+            # Czas = max(tech, deep) zamiast tech + deep
+            deep_future = _DEEP_POOL.submit(DeepAttributeAnalyzer.analyze_bytes, data)
+            tech_data = ImageAnalyzer.analyze_bytes(data, Path(self.image_path).name)
             
             if tech_data.get("error"):
                 self.error.emit(tech_data["error"])
                 self.finished.emit(False, tech_data)
                 return
             
-            self.progress.emit("🔍 Rozpoznawanie atrybutów...")
-            deep_data = DeepAttributeAnalyzer.analyze(self.image_path)
+            # Porzucona analiza: nie czekaj na cięższy etap
+            if self.cancelled.is_set():
+                deep_future.cancel()
+                logger.info("Image analysis cancelled: %s", self.image_path)
+                return
+            
+            deep_data = deep_future.result()
             
-            result = {
-                **tech_data,
-                **deep_data,
-            }
+            # Scalanie w miejscu - tech_data to świeży słownik tego wywołania
+            tech_data.update(deep_data)
+            result = tech_data
             
-            self.progress.emit("✅ Analiza zakończona")
+            # Bez osobnego "zakończono" - finished i tak zaraz ustawia status
             logger.info("Image analysis succeeded")
             self.finished.emit(True, result)
         
@@ -59,3 +98,14 @@ class ImageAnalysisWorker(QThread):
             logger.error(msg, exc_info=True)
             self.error.emit(msg)
             self.finished.emit(False, {"error": msg})
+
+
+class ImageAnalysisRunnable(QRunnable):
+    """Zadanie puli wątków wykonujące ImageAnalysisWorker.run()"""
+    
+    def __init__(self, worker: ImageAnalysisWorker):
+        super().__init__()
+        self.worker = worker
+    
+    def run(self):
+        self.worker.run()
@@ -0,0 +1,36 @@
+"""
+Prewarm - load the enhancement model while the UI starts
+
+Without it the first click pays the Ollama model load (seconds) on top of
+generation. The warm-up runs on a daemon thread once the event loop is
+idle, reusing the window's EnhancementWorker so its keep-alive connection
+is opened as well. Failures are only logged - startup never depends on it.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from PyQt5.QtCore import QTimer
+
+from workers.enhancement_worker import EnhancementWorker
+
+logger = logging.getLogger(__name__)
+
+
+def prewarm(worker: EnhancementWorker, model: Optional[str] = None) -> None:
+    """Load the model into Ollama memory (blocking; run off the GUI thread)"""
+    try:
+        if not worker._probe_ollama():
+            logger.info("Prewarm skipped: Ollama is not running")
+            return
+        worker.warm_up(model)
+    except Exception as e:
+        logger.warning("Prewarm failed: %s", e)
+
+
+def schedule_prewarm(worker: EnhancementWorker, model: Optional[str] = None) -> None:
+    """Start prewarm on a daemon thread as soon as the event loop is idle"""
+    QTimer.singleShot(0, lambda: threading.Thread(
+        target=prewarm, args=(worker, model), name="prewarm", daemon=True
+    ).start())